@@ -14,16 +14,30 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import argparse
+import glob
 import os
 import sys
 
-from pytab2gis.io.excel_reader import ExcelReader
-from pytab2gis.table.table_detector import TableDetector
+import numpy as np
+
+from pytab2gis.io.table_readers import open_reader, DISCOVERED_EXTENSIONS
+from pytab2gis.io.sheet_cache import SheetCache, DEFAULT_MAX_BYTES
+from pytab2gis.table.column_finder import ColumnFinder
+from pytab2gis.table.table_detector import TableDetector, stream_table_blocks
+from pytab2gis.table.figure_detector import detect_figure_blocks
 from pytab2gis.figures.figure_builder import FigureBuilder
+from pytab2gis.figures.figure_collection import FigureCollection
 from pytab2gis.figures.geometry_checks import GeometryChecker
-from pytab2gis.crs.crs_manager import CRSDefinition, CRSManager
-from pytab2gis.export.shp_exporter import ShapefileExporter
-from pytab2gis.export.zip_exporter import ZipExporter
+from pytab2gis.figures.topology_checks import TopologyChecker
+from pytab2gis.figures.deduplication import Deduplicator, DUPLICATE_POLICIES
+from pytab2gis.figures.vertex_checks import VertexChecker
+from pytab2gis.crs.crs_manager import (
+    CRSDefinition,
+    CRSManager,
+    get_crs_manager,
+)
+from pytab2gis.export.exporter import export_geometries
+from pytab2gis.core.parallel import imap_completed, map_ordered, resolve_jobs
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -36,14 +50,36 @@ def build_parser() -> argparse.ArgumentParser:
     )
 
     parser.add_argument(
-        "input",
-        help="Input Excel (.xlsx) file"
+        "inputs",
+        nargs="+",
+        metavar="input",
+        help=(
+            "Input tables: Excel (.xlsx), CSV, Parquet or Feather files, "
+            "directories or glob patterns"
+        )
+    )
+
+    parser.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Search input directories recursively"
     )
 
     parser.add_argument(
         "--component-column",
-        required=True,
-        help="Column name containing figure/component names"
+        help=(
+            "Column name containing figure/component names. If omitted, "
+            "figures are split where the vertex number resets"
+        )
+    )
+
+    parser.add_argument(
+        "--vertex-column",
+        default="VERTICE",
+        help=(
+            "Numeric vertex column used to split figures when no "
+            "component column is given (default: VERTICE)"
+        )
     )
 
     parser.add_argument(
@@ -57,9 +93,27 @@ def build_parser() -> argparse.ArgumentParser:
         help="PROJ string defining the input CRS"
     )
 
+    parser.add_argument(
+        "--target-epsg",
+        type=int,
+        help="Reproject the output to this EPSG code (default: input CRS)"
+    )
+
+    parser.add_argument(
+        "--densify",
+        type=float,
+        help=(
+            "With --target-epsg, split edges longer than this length "
+            "(input CRS units) before reprojecting"
+        )
+    )
+
     parser.add_argument(
         "--sheet",
-        help="Specific Excel sheet to process (default: all sheets)"
+        help=(
+            "Specific Excel sheet to process (default: all sheets); "
+            "single-table formats have one sheet named after the file"
+        )
     )
 
     parser.add_argument(
@@ -81,9 +135,474 @@ def build_parser() -> argparse.ArgumentParser:
         help="Minimum polygon area for geometry checks (default: 0)"
     )
 
+    parser.add_argument(
+        "--vertex-checks",
+        action="store_true",
+        help=(
+            "Report duplicate vertices, zero-length edges, spikes and "
+            "self-intersection locations with their source rows"
+        )
+    )
+
+    parser.add_argument(
+        "--spike-angle",
+        type=float,
+        default=5.0,
+        help="With --vertex-checks, vertex angle in degrees below which "
+             "a vertex is a spike (default: 5)"
+    )
+
+    parser.add_argument(
+        "--duplicates",
+        choices=DUPLICATE_POLICIES,
+        help=(
+            "Detect figures repeated within an input file, across its "
+            "sheets (any winding or start vertex), and skip, merge or "
+            "just report the copies. Batch inputs are not compared "
+            "with each other"
+        )
+    )
+
+    parser.add_argument(
+        "--duplicate-tolerance",
+        type=float,
+        default=0.0,
+        help=(
+            "With --duplicates, coordinate grid used to match "
+            "near-exact copies (CRS units; default: 0, exact)"
+        )
+    )
+
+    parser.add_argument(
+        "--topology",
+        action="store_true",
+        help=(
+            "Check figures of each input against each other for "
+            "overlaps, near-duplicates and slivers (spatial index)"
+        )
+    )
+
+    parser.add_argument(
+        "--gap-tolerance",
+        type=float,
+        default=0.0,
+        help=(
+            "With --topology, also report gaps narrower than this "
+            "distance between neighbouring figures (default: 0, off)"
+        )
+    )
+
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Keep a manifest in the output directory; re-runs skip "
+            "unchanged figures and delete outputs of removed ones"
+        )
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Read sheets row by row in read-only mode; memory is "
+            "bounded by the largest figure instead of the workbook"
+        )
+    )
+
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            "Cache parsed sheets on disk; repeat runs on an unchanged "
+            "file skip Excel decoding"
+        )
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        help="Cache directory (implies --cache; default: ~/.cache/pytab2gis)"
+    )
+
+    parser.add_argument(
+        "--cache-size-mb",
+        type=int,
+        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="Cache size limit before LRU eviction (default: 512)"
+    )
+
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help=(
+            "Worker processes (0 = one per CPU core; default: 1). "
+            "Several inputs are processed one file per worker; a single "
+            "input is split by sheet"
+        )
+    )
+
     return parser
 
 
+def _sheet_xy(header):
+    """
+    Resolves the X/Y columns of a sheet once from its header row.
+    Returns None when they cannot be identified; the error is then
+    reported per block by FigureBuilder.
+    """
+    try:
+        return ColumnFinder(header).find_xy_columns()
+    except ValueError:
+        return None
+
+
+def _projection(args, xy) -> list:
+    """
+    The columns the CLI actually reads (component or vertex + X/Y),
+    so sheet bodies are parsed projected.
+    """
+    columns = [args.component_column or args.vertex_column]
+
+    if xy is not None:
+        columns.extend(c for c in xy if c not in columns)
+
+    return columns
+
+
+def expand_inputs(patterns, recursive: bool = False) -> list:
+    """
+    Expands files, directories and glob patterns into a sorted,
+    de-duplicated list of supported input files.
+    """
+    files = []
+
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            search = os.path.join(pattern, "**", "*") if recursive \
+                else os.path.join(pattern, "*")
+            matches = glob.glob(search, recursive=recursive)
+        elif glob.has_magic(pattern):
+            matches = glob.glob(pattern, recursive=recursive)
+        else:
+            # Plain paths are kept so missing files are reported
+            files.append(pattern)
+            continue
+
+        files.extend(
+            m for m in sorted(matches)
+            if os.path.isfile(m)
+            and m.lower().endswith(DISCOVERED_EXTENSIONS)
+            # Skip Excel lock files
+            and not os.path.basename(m).startswith("~$")
+        )
+
+    seen = set()
+    unique = []
+    for f in files:
+        key = os.path.normcase(os.path.abspath(f))
+        if key not in seen:
+            seen.add(key)
+            unique.append(f)
+
+    return unique
+
+
+def _output_dirs(files, output: str) -> list:
+    """
+    One output folder per input in batch mode, named after the
+    file (suffixed on name clashes).
+    """
+    if len(files) == 1:
+        return [output]
+
+    dirs = []
+    used = {}
+    for path in files:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        used[stem] = used.get(stem, 0) + 1
+        name = stem if used[stem] == 1 else f"{stem}_{used[stem]}"
+        dirs.append(os.path.join(output, name))
+
+    return dirs
+
+
+def _open_reader(args, path):
+    cache = None
+    if args.cache or args.cache_dir:
+        cache = SheetCache(
+            args.cache_dir,
+            max_bytes=args.cache_size_mb * 1024 * 1024
+        )
+
+    return open_reader(path, cache=cache)
+
+
+def _iter_blocks(reader, args, sheet_name, xy=None):
+    """
+    Yields the table blocks of one sheet.
+    In streaming mode, blocks are produced lazily.
+    """
+    columns = _projection(args, xy)
+
+    if args.stream:
+        for _, names, rows in reader.iter_sheet_rows(
+            sheet_name, columns=columns
+        ):
+            yield from stream_table_blocks(
+                names, rows, args.component_column
+            )
+        return
+
+    sheets = reader.read(sheet_name=sheet_name, columns=columns)
+
+    for df in sheets.values():
+        if args.component_column is None:
+            yield from detect_figure_blocks(df, args.vertex_column)
+            continue
+
+        detector = TableDetector(
+            df=df,
+            component_column=args.component_column
+        )
+
+        yield from detector.detect_tables()
+
+
+def _process_sheet(task, reader=None):
+    """
+    Parses one sheet and builds its figures. The collection is
+    None when the sheet was skipped.
+
+    Runs in a worker process with --jobs, so it only takes and
+    returns picklable data. Messages are returned as
+    (stream, text) pairs and printed by the parent in sheet order.
+    ``header`` is the sheet's header row, read once per file;
+    serial runs pass the file's open ``reader``.
+    """
+    args, path, sheet_name, header = task
+    log = []
+
+    crs_manager = CRSManager(
+        CRSDefinition(epsg=args.epsg, proj_string=args.proj)
+    )
+    builder = FigureBuilder(crs_manager)
+    checker = GeometryChecker(min_area=args.min_area)
+
+    if reader is None:
+        reader = _open_reader(args, path)
+
+    # Sheets without the component (or, in vertex-reset mode, a
+    # numeric vertex) column are notes or lookups and hold no
+    # figures: skip them rather than failing the whole file
+    split_column = args.component_column or args.vertex_column
+    kind = "Component" if args.component_column else "Vertex"
+
+    if split_column not in header:
+        log.append((
+            "out",
+            f"[WARNING] {kind} column '{split_column}' "
+            f"not found in sheet '{sheet_name}'; sheet skipped."
+        ))
+        return sheet_name, None, log
+
+    xy = _sheet_xy(header)
+
+    # Blocks are consumed as they are detected (one at a time in
+    # streaming mode) and counted on the way
+    n_blocks = 0
+    skipped = []
+
+    def blocks():
+        nonlocal n_blocks
+        try:
+            for block in _iter_blocks(reader, args, sheet_name, xy):
+                n_blocks += 1
+                yield block
+        except ValueError as e:
+            # Vertex-reset split over non-numeric vertices ("V1")
+            if args.component_column is not None:
+                raise
+            skipped.append(str(e))
+
+    collection = builder.build_many(blocks(), xy_columns=xy)
+
+    if skipped:
+        log.append((
+            "out",
+            f"[WARNING] {skipped[0]} Sheet '{sheet_name}' skipped."
+        ))
+        return sheet_name, None, log
+
+    log.append(("out", f"[INFO] Detected {n_blocks} table blocks"))
+
+    for i in np.flatnonzero(collection.dropped):
+        log.append((
+            "out",
+            f"[WARNING] Figure '{collection.names[i]}': "
+            f"{collection.dropped[i]} row(s) "
+            "without numeric coordinates were skipped."
+        ))
+
+    # Geometry checks (warnings only)
+    for w in checker.check_many(collection).messages():
+        log.append(("out", f"[WARNING] {w}"))
+
+    if args.vertex_checks:
+        diagnostics = VertexChecker(
+            spike_angle=args.spike_angle
+        ).check(collection)
+
+        for w in diagnostics.messages():
+            log.append(("out", f"[WARNING] {w}"))
+
+        log.append(("out", f"[INFO] Vertex checks: {diagnostics.summary()}"))
+
+    for name, message in collection.rejected:
+        log.append((
+            "err",
+            f"[ERROR] Failed to build figure '{name}': {message}"
+        ))
+
+    collection.sources[:] = _source_label(path, sheet_name)
+
+    return sheet_name, collection, log
+
+
+def _init_worker():
+    """
+    Pays the heavy GIS imports once per worker process instead of
+    once per input file.
+    """
+    import geopandas  # noqa: F401
+    import pyproj  # noqa: F401
+
+
+def _source_label(path, sheet_name):
+    """
+    Input sheet label recorded per figure (and in the manifest).
+    """
+    return f"{os.path.basename(path)}::{sheet_name}"
+
+
+def _process_file(task):
+    """
+    Converts one input file: reads and builds every sheet, then
+    exports. Returns (path, n_figures, error, log); never raises,
+    so one bad file does not stop a batch.
+    """
+    args, path, output_dir, jobs = task
+    log = []
+
+    try:
+        reader = _open_reader(args, path)
+
+        with reader.session():
+            headers = reader.read_headers(args.sheet)
+            tasks = [
+                (args, path, name, list(header))
+                for name, header in headers.items()
+            ]
+
+            # Serial: every sheet is read from the one open workbook
+            serial = min(resolve_jobs(jobs), len(tasks)) <= 1
+            if serial:
+                results = [_process_sheet(t, reader) for t in tasks]
+
+        if not serial:
+            results = map_ordered(_process_sheet, tasks, jobs=jobs)
+
+        collections = []
+        processed = []
+
+        for sheet_name, collection, sheet_log in results:
+            log.append(("out", f"[INFO] Processing sheet: {sheet_name}"))
+            log.extend(sheet_log)
+
+            if collection is None:
+                continue
+
+            collections.append(collection)
+            processed.append(_source_label(path, sheet_name))
+
+        if not collections or not sum(map(len, collections)):
+            raise RuntimeError("No valid figures were generated.")
+
+        collection = FigureCollection.concat(collections)
+
+        # Degrees vs. metres and wrong-zone check over all vertices
+        for w in get_crs_manager(collection.crs_id).check_coordinate_ranges(
+            collection.coords
+        ):
+            log.append(("out", f"[WARNING] {w}"))
+
+        if args.duplicates:
+            collection, duplicates = Deduplicator(
+                args.duplicates,
+                tolerance=args.duplicate_tolerance
+            ).apply(collection)
+
+            for w in duplicates.messages():
+                log.append(("out", f"[WARNING] {w}"))
+
+            log.append(("out", f"[INFO] Duplicates: {duplicates.summary()}"))
+
+        if args.topology:
+            report = TopologyChecker(
+                gap_tolerance=args.gap_tolerance
+            ).check(collection)
+
+            for w in report.messages():
+                log.append(("out", f"[WARNING] {w}"))
+
+            log.append(("out", f"[INFO] Topology: {report.summary()}"))
+
+        if args.target_epsg is not None:
+            collection = collection.to_crs(
+                args.target_epsg,
+                densify=args.densify
+            )
+            log.append(
+                ("out", f"[INFO] Reprojected to {collection.crs_id}")
+            )
+
+        geometries = collection.to_geometries()
+
+        exported = export_geometries(
+            geometries=geometries,
+            output_dir=output_dir,
+            epsg=args.target_epsg or args.epsg,
+            export_format="SHP",
+            zip_output=args.zip,
+            crs=get_crs_manager(collection.crs_id).crs,
+            incremental=args.incremental,
+            sources=list(collection.sources),
+            processed_sources=processed
+        )
+
+        log.append(
+            ("out", f"[INFO] Exported {len(exported.written)} shapefiles")
+        )
+
+        if args.incremental:
+            log.append((
+                "out",
+                f"[INFO] Unchanged (skipped): {len(exported.skipped)}, "
+                f"removed: {len(exported.removed)}"
+            ))
+
+        return path, len(geometries), None, log
+
+    except Exception as e:
+        log.append(("err", f"[ERROR] {path}: {e}"))
+        return path, 0, str(e), log
+
+
+def _print_log(log):
+    for stream, message in log:
+        print(message, file=sys.stderr if stream == "err" else sys.stdout)
+
+
 def main():
     parser = build_parser()
     args = parser.parse_args()
@@ -95,6 +614,12 @@ def main():
     if args.epsg is None and args.proj is None:
         parser.error("You must specify either --epsg or --proj.")
 
+    if args.stream and args.component_column is None:
+        parser.error("--stream requires --component-column.")
+
+    if args.densify is not None and args.target_epsg is None:
+        parser.error("--densify requires --target-epsg.")
+
     crs_def = CRSDefinition(
         epsg=args.epsg,
         proj_string=args.proj
@@ -104,75 +629,79 @@ def main():
 
     print(f"[INFO] Using CRS: {crs_manager.summary()}")
 
-    # --------------------------------------------------
-    # READ EXCEL
-    # --------------------------------------------------
-
-    reader = ExcelReader(args.input)
-    sheets = reader.read(sheet_name=args.sheet)
-
-    all_figures = []
+    if args.target_epsg is not None:
+        target = CRSManager(CRSDefinition(epsg=args.target_epsg))
+        print(f"[INFO] Output CRS: {target.summary()}")
 
     # --------------------------------------------------
-    # PROCESS EACH SHEET
+    # INPUTS
     # --------------------------------------------------
 
-    for sheet_name, df in sheets.items():
-        print(f"[INFO] Processing sheet: {sheet_name}")
+    files = expand_inputs(args.inputs, recursive=args.recursive)
 
-        detector = TableDetector(
-            df=df,
-            component_column=args.component_column
-        )
-
-        blocks = detector.detect_tables()
-        print(f"[INFO] Detected {len(blocks)} table blocks")
-
-        builder = FigureBuilder(crs_manager)
-        checker = GeometryChecker(min_area=args.min_area)
-
-        for block in blocks:
-            try:
-                fig = builder.build(block)
-
-                # Geometry checks (warnings only)
-                warnings = checker.check(fig)
-                for w in warnings:
-                    print(f"[WARNING] {w}")
+    if not files:
+        parser.error("No supported input files found.")
 
-                fig.close()
-                all_figures.append(fig)
-
-            except Exception as e:
-                print(
-                    f"[ERROR] Failed to build figure '{block.name}': {e}",
-                    file=sys.stderr
-                )
-
-    if not all_figures:
-        print("[ERROR] No valid figures were generated.", file=sys.stderr)
-        sys.exit(1)
+    output_dirs = _output_dirs(files, args.output)
 
     # --------------------------------------------------
-    # EXPORT SHAPEFILES
+    # SINGLE FILE: parallel by sheet
     # --------------------------------------------------
 
-    os.makedirs(args.output, exist_ok=True)
-
-    exporter = ShapefileExporter(args.output)
-    shp_files = exporter.export(all_figures)
+    if len(files) == 1:
+        _, n_figures, error, log = _process_file(
+            (args, files[0], output_dirs[0], args.jobs)
+        )
+        _print_log(log)
 
-    print(f"[INFO] Exported {len(shp_files)} shapefiles")
+        if error is not None:
+            sys.exit(1)
+        return
 
     # --------------------------------------------------
-    # ZIP OUTPUT (OPTIONAL)
+    # BATCH: one file per worker, long-lived workers
     # --------------------------------------------------
 
-    if args.zip:
-        zip_path = os.path.join(args.output, "pytab2gis_output.zip")
-        zipper = ZipExporter(zip_path)
-        zipper.package(shp_files)
-        print(f"[INFO] ZIP archive created: {zip_path}")
+    print(f"[INFO] Processing {len(files)} input files")
+
+    # Each file's log and status are printed as soon as it finishes
+    results = [None] * len(files)
+    failed = 0
+
+    for i, result in imap_completed(
+        _process_file,
+        [(args, path, out, 1) for path, out in zip(files, output_dirs)],
+        jobs=args.jobs,
+        initializer=_init_worker
+    ):
+        path, n_figures, error, log = result
+        results[i] = result
+
+        print(f"[INFO] === {path}")
+        _print_log(log)
+
+        if error is None:
+            print(f"  OK     {path} ({n_figures} figures)")
+        else:
+            failed += 1
+            print(f"  FAILED {path}: {error}")
+
+        sys.stdout.flush()
+
+    print("[SUMMARY]")
+    for path, n_figures, error, _ in results:
+        if error is None:
+            print(f"  OK     {path} ({n_figures} figures)")
+        else:
+            print(f"  FAILED {path}: {error}")
+
+    print(
+        f"[SUMMARY] {len(results) - failed} succeeded, "
+        f"{failed} failed, {len(results)} total"
+    )
+
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -14,7 +14,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 
 @dataclass
@@ -23,3 +23,23 @@ class TableConfig:
     y_column: str = "NORTE"
     vertex_column: str = "VERTICE"
     component_column: Optional[str] = None
+    # Without a component column: start a new figure whenever the
+    # vertex number does not increase
+    split_on_vertex_reset: bool = False
+    # Duplicate figures: None (not checked), "skip", "merge" or
+    # "report" (keep all; the pipeline hands back the report); see
+    # figures.deduplication.Deduplicator
+    duplicate_policy: Optional[str] = None
+    duplicate_tolerance: float = 0.0
+
+    def required_columns(self) -> List[str]:
+        """
+        Columns read by geometry construction; used for
+        column-projected reads.
+        """
+        columns = [self.x_column, self.y_column, self.vertex_column]
+
+        if self.component_column:
+            columns.append(self.component_column)
+
+        return columns
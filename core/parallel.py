@@ -0,0 +1,95 @@
+# Copyright (c) 2026 Jordan Zavaleta
+# This file is part of PyTAB2GIS.
+# PyTAB2GIS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """
+    Normalizes a --jobs value: None / 1 → serial,
+    0 or negative → one worker per CPU core.
+    """
+    if jobs is None:
+        return 1
+
+    if jobs <= 0:
+        return os.cpu_count() or 1
+
+    return jobs
+
+
+def map_ordered(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    jobs: Optional[int] = 1,
+    initializer: Optional[Callable] = None
+) -> List[R]:
+    """
+    Applies ``func`` to every item, in a process pool when
+    ``jobs`` > 1. Results always come back in input order.
+
+    ``func`` and the items must be picklable (module-level
+    functions, plain data).
+    """
+    items = list(items)
+    jobs = min(resolve_jobs(jobs), len(items))
+
+    if jobs <= 1:
+        if initializer is not None:
+            initializer()
+        return [func(item) for item in items]
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=initializer
+    ) as pool:
+        return list(pool.map(func, items))
+
+
+def imap_completed(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    jobs: Optional[int] = 1,
+    initializer: Optional[Callable] = None
+) -> Iterator[Tuple[int, R]]:
+    """
+    Like ``map_ordered``, but yields ``(position, result)`` as soon
+    as each item finishes (completion order), so callers can report
+    progress while the rest is still running.
+    """
+    items = list(items)
+    jobs = min(resolve_jobs(jobs), len(items))
+
+    if jobs <= 1:
+        if initializer is not None:
+            initializer()
+        for i, item in enumerate(items):
+            yield i, func(item)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=initializer
+    ) as pool:
+        futures = {pool.submit(func, item): i for i, item in enumerate(items)}
+
+        for future in as_completed(futures):
+            yield futures[future], future.result()
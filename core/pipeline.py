@@ -14,16 +14,21 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import pandas as pd
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from shapely.geometry import Polygon
 
 from pytab2gis.config.table_config import TableConfig
 from pytab2gis.io.excel_reader import build_geometries_from_table
+from pytab2gis.io.table_readers import open_reader
+from pytab2gis.core.parallel import map_ordered
+from pytab2gis.figures.deduplication import Deduplicator, DuplicateReport
 
 
 def build_geometries_from_table_pipeline(
     df: pd.DataFrame,
-    config: TableConfig
+    config: TableConfig,
+    reports: Optional[List[DuplicateReport]] = None,
+    deduplicate: bool = True
 ) -> List[Tuple[str, Polygon]]:
     """
     FINAL PIPELINE FOR EXCEL TABLES.
@@ -33,6 +38,9 @@ def build_geometries_from_table_pipeline(
     - uses the selected column to define figure limits
     - supports Excel with merged / empty cells
     - produces valid Shapely geometries
+    - drops, merges or reports duplicate figures
+      (``config.duplicate_policy``); the DuplicateReport is
+      appended to ``reports`` when given
     """
 
     # -----------------------------
@@ -40,6 +48,9 @@ def build_geometries_from_table_pipeline(
     # -----------------------------
     geometries = build_geometries_from_table(df, config)
 
+    if deduplicate:
+        geometries = _deduplicate(geometries, config, reports)
+
     # -----------------------------
     # Final sanity check
     # -----------------------------
@@ -47,3 +58,79 @@ def build_geometries_from_table_pipeline(
         raise RuntimeError("No valid geometries were generated.")
 
     return geometries
+
+
+def _build_sheet(task) -> List[Tuple[str, Polygon]]:
+    """
+    Worker: reads one sheet (column-projected) and builds its
+    geometries.
+    """
+    path, sheet_name, config, cache = task
+
+    reader = open_reader(path, cache=cache)
+    sheets = reader.read(
+        sheet_name=sheet_name,
+        columns=config.required_columns()
+    )
+
+    geometries: List[Tuple[str, Polygon]] = []
+    for df in sheets.values():
+        # Duplicates are handled once for the whole file
+        geometries.extend(
+            build_geometries_from_table_pipeline(df, config, deduplicate=False)
+        )
+
+    return geometries
+
+
+def build_geometries_from_file(
+    path: str,
+    config: TableConfig,
+    jobs: int = 1,
+    cache=None,
+    reports: Optional[List[DuplicateReport]] = None
+) -> List[Tuple[str, Polygon]]:
+    """
+    Runs the table pipeline over every sheet of an input file.
+
+    With ``jobs`` > 1 (0 = all cores) sheets are parsed and built
+    in separate worker processes. Geometries are returned in
+    sheet order regardless of completion order.
+
+    Duplicates (``config.duplicate_policy``) are looked for across
+    all sheets in one pass; its DuplicateReport is appended to
+    ``reports`` when given.
+    """
+    sheet_names = list(open_reader(path).read_headers())
+
+    results = map_ordered(
+        _build_sheet,
+        [(path, name, config, cache) for name in sheet_names],
+        jobs=jobs
+    )
+
+    # Duplicates within and across sheets
+    return _deduplicate(
+        [geom for sheet in results for geom in sheet],
+        config,
+        reports
+    )
+
+
+def _deduplicate(
+    geometries: List[Tuple[str, Polygon]],
+    config: TableConfig,
+    reports: Optional[List[DuplicateReport]] = None
+) -> List[Tuple[str, Polygon]]:
+    if not config.duplicate_policy or not geometries:
+        return geometries
+
+    geometries, report = Deduplicator(
+        config.duplicate_policy,
+        tolerance=config.duplicate_tolerance
+    ).apply_geometries(geometries)
+
+    if reports is not None:
+        reports.append(report)
+
+    return geometries
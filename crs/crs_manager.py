@@ -13,11 +13,24 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional, Tuple, List
+from functools import lru_cache
+from typing import Optional, List
 
+import numpy as np
 import pyproj
 
+from pytab2gis.crs.crs_presets import (
+    EXPECTED_REGION, get_preset, outside_bounds, presets_containing
+)
+
+
+# Bound of each shared CRS cache (CRS objects, WKT strings,
+# Transformers)
+CRS_CACHE_SIZE = 64
+
 
 @dataclass
 class CRSDefinition:
@@ -39,13 +52,34 @@ class CRSDefinition:
         ValueError
             If neither EPSG code nor PROJ string is provided.
         """
+        if self.epsg is None and self.proj_string is None:
+            raise ValueError("CRSDefinition requires either an EPSG code or a PROJ string.")
+
+        # Shared, resolved once per process
+        return _crs_from_key(self.id)
+
+    @property
+    def id(self) -> str:
+        """
+        Stable identifier of the definition ("EPSG:32718" or
+        "PROJ:<string>"), shared by every object using this CRS.
+        """
         if self.epsg is not None:
-            return pyproj.CRS.from_epsg(self.epsg)
+            return f"EPSG:{self.epsg}"
+
+        return f"PROJ:{self.proj_string}"
+
+    @classmethod
+    def from_id(cls, crs_id: str) -> "CRSDefinition":
+        kind, _, value = crs_id.partition(":")
+
+        if kind == "EPSG":
+            return cls(epsg=int(value))
 
-        if self.proj_string is not None:
-            return pyproj.CRS.from_string(self.proj_string)
+        if kind == "PROJ":
+            return cls(proj_string=value)
 
-        raise ValueError("CRSDefinition requires either an EPSG code or a PROJ string.")
+        raise ValueError(f"Unknown CRS id: {crs_id}")
 
 
 class CRSManager:
@@ -58,6 +92,10 @@ class CRSManager:
         self.crs_def = crs_def
         self.crs = self._validate_crs()
 
+    @property
+    def id(self) -> str:
+        return self.crs_def.id
+
     # --------------------------------------------------
     # CRS VALIDATION
     # --------------------------------------------------
@@ -77,18 +115,24 @@ class CRSManager:
 
     def check_coordinate_ranges(
         self,
-        coordinates: List[Tuple[float, float]]
+        coordinates
     ) -> List[str]:
         """
-        Performs basic consistency checks between CRS type
-        and coordinate numeric ranges.
+        Performs consistency checks between the CRS and coordinate
+        numeric ranges.
+
+        Besides the degrees vs. metres heuristic, CRSs listed in
+        ``crs_presets`` are checked against their EPSG area of use,
+        then against their expected extent in ``EXPECTED_REGION``,
+        which hints at coordinates typed in the wrong UTM zone. All
+        checks are vectorized over the vertices.
 
         This method never blocks execution.
         It only returns warnings.
 
         Parameters
         ----------
-        coordinates : list of (x, y)
+        coordinates : (N, 2) array or list of (x, y)
 
         Returns
         -------
@@ -97,14 +141,23 @@ class CRSManager:
         """
         warnings = []
 
-        if not coordinates:
+        if len(coordinates) == 0:
             warnings.append("No coordinates provided for CRS validation.")
             return warnings
 
-        xs, ys = zip(*coordinates)
+        coords = np.asarray(coordinates, dtype="float64").reshape(-1, 2)
+
+        # Row-wise reductions on (N, 2) are slow; filter only if needed
+        if not np.isfinite(coords).all():
+            coords = coords[np.isfinite(coords).all(axis=1)]
+
+        if len(coords) == 0:
+            warnings.append("No numeric coordinates provided for CRS validation.")
+            return warnings
 
-        x_min, x_max = min(xs), max(xs)
-        y_min, y_max = min(ys), max(ys)
+        xs, ys = coords[:, 0], coords[:, 1]
+        x_min, x_max = xs.min(), xs.max()
+        y_min, y_max = ys.min(), ys.max()
 
         # Projected CRS (e.g. UTM)
         if self.crs.is_projected:
@@ -122,6 +175,45 @@ class CRSManager:
                     "exceed degree ranges."
                 )
 
+        # Area of use of known regional CRSs (hard bound), then their
+        # expected regional extent (soft wrong-zone hint: projected
+        # UTM zones share one area of use)
+        preset = get_preset(self.crs_def.epsg)
+        extent = (x_min, y_min, x_max, y_max)
+
+        if preset is not None and not warnings:
+            outside = int(np.count_nonzero(outside_bounds(coords, preset.bounds)))
+
+            if outside:
+                warnings.append(
+                    f"{outside} of {len(coords)} vertices fall outside the "
+                    f"area of use of EPSG:{preset.epsg} "
+                    f"({preset.name}, {preset.region}); check the CRS."
+                )
+
+            elif preset.expected is not None:
+                outside = int(np.count_nonzero(
+                    outside_bounds(coords, preset.expected)
+                ))
+
+                if outside:
+                    message = (
+                        f"{outside} of {len(coords)} vertices fall outside the "
+                        f"expected {EXPECTED_REGION} extent of "
+                        f"EPSG:{preset.epsg} ({preset.name}); if the survey is "
+                        f"in {EXPECTED_REGION}, check the UTM zone."
+                    )
+
+                    fits = [
+                        f"EPSG:{p.epsg}"
+                        for p in presets_containing(extent, expected=True)
+                        if p.datum == preset.datum
+                    ]
+                    if fits:
+                        message += f" Coordinates fit: {', '.join(fits)}."
+
+                    warnings.append(message)
+
         return warnings
 
     # --------------------------------------------------
@@ -136,3 +228,144 @@ class CRSManager:
             return f"EPSG:{self.crs_def.epsg}"
 
         return f"PROJ: {self.crs_def.proj_string}"
+
+
+# --------------------------------------------------
+# SHARED MANAGERS
+# --------------------------------------------------
+
+# One CRSManager per CRS id, shared by all figures of a process.
+# Bounded like the CRS caches below: least recently used managers
+# are dropped and re-created from their id on demand.
+_MANAGERS: "OrderedDict[str, CRSManager]" = OrderedDict()
+_MANAGERS_LOCK = threading.Lock()
+
+
+def _remember_manager(manager: CRSManager) -> None:
+    # Caller holds _MANAGERS_LOCK
+    _MANAGERS[manager.id] = manager
+    _MANAGERS.move_to_end(manager.id)
+
+    while len(_MANAGERS) > CRS_CACHE_SIZE:
+        _MANAGERS.popitem(last=False)
+
+
+def register_crs_manager(manager: CRSManager) -> str:
+    """
+    Makes ``manager`` the shared instance for its CRS id and
+    returns the id.
+    """
+    with _MANAGERS_LOCK:
+        _remember_manager(_MANAGERS.get(manager.id, manager))
+    return manager.id
+
+
+def get_crs_manager(crs_id: str) -> CRSManager:
+    """
+    Shared CRSManager for a CRS id, created on first use (e.g. for
+    figures unpickled from a worker process).
+    """
+    with _MANAGERS_LOCK:
+        manager = _MANAGERS.get(crs_id)
+
+        if manager is None:
+            manager = CRSManager(CRSDefinition.from_id(crs_id))
+
+        _remember_manager(manager)
+
+    return manager
+
+
+# --------------------------------------------------
+# SHARED CRS CACHES
+# --------------------------------------------------
+#
+# CRS parsing, WKT export and Transformer creation go through the
+# PROJ database and are far slower than the per-figure work they
+# used to be repeated for. They are cached per process, keyed by
+# definition, with bounded LRU caches (``functools.lru_cache`` is
+# thread-safe).
+
+def crs_key(crs) -> str:
+    """
+    Cache key of a CRS given as pyproj.CRS, CRSDefinition, CRS id,
+    EPSG code or any string pyproj understands.
+    """
+    if isinstance(crs, pyproj.CRS):
+        # The user input the object was created from
+        return crs.srs
+
+    if isinstance(crs, CRSDefinition):
+        return crs.id
+
+    if isinstance(crs, int):
+        return f"EPSG:{crs}"
+
+    return str(crs)
+
+
+def resolve_crs(crs) -> pyproj.CRS:
+    """
+    Shared pyproj.CRS for any CRS input accepted by ``crs_key``.
+    """
+    if isinstance(crs, pyproj.CRS):
+        return crs
+
+    return _crs_from_key(crs_key(crs))
+
+
+def crs_wkt(crs, version: str = "WKT2_2019") -> str:
+    """
+    Cached WKT of a CRS; ``version="WKT1_ESRI"`` gives the text of
+    a shapefile .prj.
+    """
+    return _wkt(crs_key(crs), version)
+
+
+def get_transformer(source, target, always_xy: bool = True) -> pyproj.Transformer:
+    """
+    Cached Transformer between two CRSs. Instances are kept per
+    thread, as PROJ transformation objects must not be shared
+    between threads.
+    """
+    return _transformer(
+        crs_key(source), crs_key(target), always_xy, threading.get_ident()
+    )
+
+
+def clear_crs_caches() -> None:
+    for cache in (_crs_from_key, _wkt, _transformer):
+        cache.cache_clear()
+
+    with _MANAGERS_LOCK:
+        _MANAGERS.clear()
+
+
+@lru_cache(maxsize=CRS_CACHE_SIZE)
+def _crs_from_key(key: str) -> pyproj.CRS:
+    kind, _, value = key.partition(":")
+
+    if kind == "EPSG" and value.isdigit():
+        return pyproj.CRS.from_epsg(int(value))
+
+    if kind == "PROJ":
+        return pyproj.CRS.from_string(value)
+
+    return pyproj.CRS.from_user_input(key)
+
+
+@lru_cache(maxsize=CRS_CACHE_SIZE)
+def _wkt(key: str, version: str) -> str:
+    return _crs_from_key(key).to_wkt(version)
+
+
+@lru_cache(maxsize=CRS_CACHE_SIZE)
+def _transformer(
+    source: str,
+    target: str,
+    always_xy: bool,
+    thread: int
+) -> pyproj.Transformer:
+    return pyproj.Transformer.from_crs(
+        _crs_from_key(source), _crs_from_key(target), always_xy=always_xy
+    )
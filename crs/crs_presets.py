@@ -13,3 +13,149 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class CRSPreset:
+    """
+    Common regional CRS with its extents.
+
+    ``bounds`` is (xmin, ymin, xmax, ymax) in the units of the CRS
+    (metres for UTM, degrees for geographic CRSs). ``lonlat`` is the
+    same extent in degrees. Both follow the EPSG area of use of the
+    CRS: coordinates outside are not valid for it.
+
+    ``expected`` is the part of that area inside ``EXPECTED_REGION``
+    (UTM presets only), in CRS units. All southern UTM zones share
+    the same projected area of use, so only this regional clip can
+    hint at coordinates typed in the wrong zone; data outside it may
+    still be valid elsewhere.
+    """
+    epsg: int
+    name: str
+    region: str
+    lonlat: Tuple[float, float, float, float]
+    bounds: Tuple[float, float, float, float]
+    expected: Optional[Tuple[float, float, float, float]] = None
+
+    @property
+    def datum(self) -> str:
+        return self.name.split(" / ")[0]
+
+
+# Region of the ``expected`` extents (lon/lat clip of the area of use)
+EXPECTED_REGION = "Peru"
+
+
+# Extents precomputed from the EPSG area of use (pyproj database)
+# and projected with Transformer.transform_bounds; shipped so no
+# PROJ lookup is needed at run time. Expected extents are the same
+# areas intersected with Peru (-81.41, -18.36, -68.65, -0.03).
+# Grouped by datum, current datums first (WGS 84, SIRGAS 2000, then
+# PSAD56).
+PRESETS: Dict[int, CRSPreset] = {
+    preset.epsg: preset
+    for preset in (
+        # Geographic
+        CRSPreset(4326, "WGS 84", "World",
+                  (-180.0, -90.0, 180.0, 90.0),
+                  (-180.0, -90.0, 180.0, 90.0)),
+        CRSPreset(4674, "SIRGAS 2000", "Latin America",
+                  (-122.19, -59.87, -25.28, 32.72),
+                  (-122.19, -59.87, -25.28, 32.72)),
+        CRSPreset(4248, "PSAD56", "South America",
+                  (-81.41, -43.5, -47.99, 12.68),
+                  (-81.41, -43.5, -47.99, 12.68)),
+
+        # WGS 84 / UTM
+        CRSPreset(32717, "WGS 84 / UTM zone 17S", "84°W to 78°W, 80°S to equator",
+                  (-84.0, -80.0, -78.0, 0.0),
+                  (166021.0, 1116915.0, 833979.0, 10000000.0),
+                  expected=(454377.0, 7967368.0, 833979.0, 9996684.0)),
+        CRSPreset(32718, "WGS 84 / UTM zone 18S", "78°W to 72°W, 80°S to equator",
+                  (-78.0, -80.0, -72.0, 0.0),
+                  (166021.0, 1116915.0, 833979.0, 10000000.0),
+                  expected=(166021.0, 7967368.0, 833979.0, 9996684.0)),
+        CRSPreset(32719, "WGS 84 / UTM zone 19S", "72°W to 66°W, 80°S to equator",
+                  (-72.0, -80.0, -66.0, 0.0),
+                  (166021.0, 1116915.0, 833979.0, 10000000.0),
+                  expected=(166021.0, 7967368.0, 538946.0, 9996684.0)),
+
+        # SIRGAS 2000 / UTM
+        CRSPreset(31977, "SIRGAS 2000 / UTM zone 17S", "South America",
+                  (-84.0, -56.45, -78.0, 0.0),
+                  (166021.0, 3739799.0, 833979.0, 10000000.0),
+                  expected=(454377.0, 7967368.0, 833979.0, 9996684.0)),
+        CRSPreset(31978, "SIRGAS 2000 / UTM zone 18S", "South America",
+                  (-78.0, -59.36, -71.99, 0.0),
+                  (166021.0, 3415993.0, 835093.0, 10000000.0),
+                  expected=(166021.0, 7967351.0, 835093.0, 9996684.0)),
+        CRSPreset(31979, "SIRGAS 2000 / UTM zone 19S", "South America",
+                  (-72.0, -59.87, -66.0, 2.15),
+                  (166025.0, 3359262.0, 833975.0, 10237969.0),
+                  expected=(166021.0, 7967368.0, 538946.0, 9996684.0)),
+
+        # PSAD56 / UTM
+        CRSPreset(24877, "PSAD56 / UTM zone 17S", "Ecuador, Peru",
+                  (-81.41, -10.53, -78.0, 0.0),
+                  (454375.0, 8834402.0, 833992.0, 10000000.0),
+                  expected=(454625.0, 8834782.0, 834228.0, 9997063.0)),
+        CRSPreset(24878, "PSAD56 / UTM zone 18S", "Chile, Ecuador, Peru",
+                  (-78.0, -43.5, -71.99, 0.0),
+                  (166008.0, 5179169.0, 835106.0, 10000000.0),
+                  expected=(166244.0, 7967705.0, 835317.0, 9997063.0)),
+        CRSPreset(24879, "PSAD56 / UTM zone 19S", "Bolivia, Chile, Peru",
+                  (-72.0, -43.5, -66.0, -2.14),
+                  (166240.0, 5179198.0, 833760.0, 9763462.0),
+                  expected=(166451.0, 7967730.0, 539122.0, 9763844.0)),
+    )
+}
+
+# Column views of the registry for vectorized lookups
+_EPSG = np.array(list(PRESETS), dtype="int64")
+_BOUNDS = np.array([p.bounds for p in PRESETS.values()], dtype="float64")
+_EXPECTED = np.array(
+    [p.expected or (np.nan,) * 4 for p in PRESETS.values()], dtype="float64"
+)
+
+
+def get_preset(epsg: Optional[int]) -> Optional[CRSPreset]:
+    return PRESETS.get(epsg) if epsg is not None else None
+
+
+def outside_bounds(
+    coordinates: np.ndarray,
+    bounds: Tuple[float, float, float, float]
+) -> np.ndarray:
+    """
+    Per-vertex flag: outside ``bounds`` (vectorized).
+    """
+    x, y = coordinates[:, 0], coordinates[:, 1]
+    xmin, ymin, xmax, ymax = bounds
+
+    return (x < xmin) | (x > xmax) | (y < ymin) | (y > ymax)
+
+
+def presets_containing(
+    extent: Tuple[float, float, float, float],
+    expected: bool = False
+) -> List[CRSPreset]:
+    """
+    Presets whose bounds (or, with ``expected``, expected regional
+    extent) contain the whole ``extent`` (xmin, ymin, xmax, ymax),
+    checked against all presets at once.
+    """
+    xmin, ymin, xmax, ymax = extent
+    bounds = _EXPECTED if expected else _BOUNDS
+
+    # NaN bounds (no expected extent) never match
+    fits = (
+        (bounds[:, 0] <= xmin) & (bounds[:, 1] <= ymin)
+        & (bounds[:, 2] >= xmax) & (bounds[:, 3] >= ymax)
+    )
+
+    return [PRESETS[int(e)] for e in _EPSG[fits]]
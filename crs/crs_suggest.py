@@ -0,0 +1,280 @@
+# Copyright (c) 2026 Jordan Zavaleta
+# This file is part of PyTAB2GIS.
+# PyTAB2GIS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pyproj
+import shapely
+from pyproj.database import query_crs_info
+from pyproj.enums import PJType
+from shapely import STRtree
+
+from pytab2gis.crs.crs_presets import PRESETS
+from pytab2gis.io.sheet_cache import DEFAULT_CACHE_DIR
+
+
+# (epsg, datum group), sorted by code for lookups. Groups follow
+# the registry order: WGS 84, SIRGAS 2000, then PSAD56.
+_DATUMS = list(dict.fromkeys(p.datum for p in PRESETS.values()))
+_PRESET_DATUM = np.array(
+    sorted((epsg, _DATUMS.index(p.datum)) for epsg, p in PRESETS.items()),
+    dtype="int64"
+).reshape(-1, 2)
+
+
+@dataclass
+class CRSSuggestion:
+    """
+    Candidate CRS for a coordinate extent. ``score`` is the share of
+    the CRS extent covered by the data (higher is a tighter fit);
+    ``preset`` marks CRSs of the regional preset registry.
+    Suggestions sharing a ``rank`` fit the data equally well and
+    cannot be told apart from the coordinates alone.
+    """
+    epsg: int
+    name: str
+    area: str
+    score: float
+    preset: bool
+    rank: int = 0
+
+
+class CRSSuggester:
+    """
+    Ranks EPSG codes whose area of use contains a coordinate extent.
+
+    The index holds, for every non-deprecated EPSG projected and
+    geographic 2D CRS of the local pyproj database, its area of use
+    expressed in the CRS's own units. Projecting ~6000 areas takes a
+    few seconds, so the index is built once per PROJ database
+    version and cached on disk; queries use an in-memory STRtree.
+
+    Projected coordinates alone cannot tell apart CRSs sharing the
+    same ranges: a UTM easting gives the distance to the central
+    meridian of whichever zone it is read in, so every southern
+    zone fits equally. Regional presets (``crs_presets``) are
+    ranked first by datum (WGS 84 before older datums), and the
+    zones of one datum share a rank instead of being guessed.
+    Other CRSs follow, tighter fits first.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self._lock = threading.Lock()
+        self._index = None
+        self._tree: Optional[STRtree] = None
+
+    # --------------------------------------------------
+    # PUBLIC API
+    # --------------------------------------------------
+
+    def suggest(
+        self,
+        extent: Tuple[float, float, float, float],
+        limit: int = 5
+    ) -> List[CRSSuggestion]:
+        """
+        Parameters
+        ----------
+        extent : (xmin, ymin, xmax, ymax)
+            Bounding box of the loaded coordinates.
+        limit : int
+            Maximum number of ranks; suggestions sharing a rank are
+            all returned.
+        """
+        index = self._load()
+
+        # Point, line or box depending on the extent
+        query = shapely.envelope(
+            shapely.multipoints([extent[:2], extent[2:]])
+        )
+        hits = self._tree.query(query, predicate="covered_by")
+
+        if not len(hits):
+            return []
+
+        bounds = index["bounds"][hits]
+        size = np.prod(bounds[:, 2:] - bounds[:, :2], axis=1)
+        data = np.prod(np.subtract(extent[2:], extent[:2]))
+
+        codes = index["codes"][hits]
+        preset = np.isin(codes, list(PRESETS))
+
+        # Presets first, by datum; then other CRSs, smallest (most
+        # specific) extent first. A CRS split at the antimeridian
+        # is listed once.
+        pos = np.searchsorted(_PRESET_DATUM[:, 0], codes)
+        datum = np.where(
+            preset, _PRESET_DATUM[np.minimum(pos, len(_PRESET_DATUM) - 1), 1], 0
+        )
+
+        order = np.lexsort((codes, np.where(preset, 0.0, size), datum, ~preset))
+        _, first = np.unique(codes[order], return_index=True)
+        order = order[np.sort(first)]
+
+        # Presets of one datum share a rank; other CRSs get their own.
+        # The limit applies to ranks, so tied zones are never cut.
+        group = np.where(preset[order], datum[order], len(_DATUMS) + np.arange(len(order)))
+        rank = np.cumsum(np.r_[True, group[1:] != group[:-1]]) - 1
+        order, rank = order[rank < limit], rank[rank < limit]
+
+        return [
+            CRSSuggestion(
+                epsg=int(codes[i]),
+                name=str(index["names"][hits[i]]),
+                area=str(index["areas"][hits[i]]),
+                score=float(data / size[i]) if size[i] > 0 else 0.0,
+                preset=bool(preset[i]),
+                rank=int(r),
+            )
+            for i, r in zip(order, rank)
+        ]
+
+    def suggest_for(self, coordinates, limit: int = 5) -> List[CRSSuggestion]:
+        """
+        Same as ``suggest`` for an (N, 2) coordinate array.
+        """
+        coords = np.asarray(coordinates, dtype="float64").reshape(-1, 2)
+        xs, ys = coords[:, 0], coords[:, 1]
+
+        if not np.isfinite(xs).any() or not np.isfinite(ys).any():
+            return []
+
+        return self.suggest(
+            (np.nanmin(xs), np.nanmin(ys), np.nanmax(xs), np.nanmax(ys)),
+            limit=limit
+        )
+
+    # --------------------------------------------------
+    # INDEX
+    # --------------------------------------------------
+
+    def index_path(self) -> str:
+        version = pyproj.database.get_database_metadata("EPSG.VERSION") or "unknown"
+        return os.path.join(
+            self.cache_dir,
+            f"crs_index_{pyproj.proj_version_str}_{version}.npz"
+        )
+
+    def _load(self) -> dict:
+        with self._lock:
+            if self._index is None:
+                path = self.index_path()
+
+                try:
+                    with np.load(path, allow_pickle=False) as f:
+                        index = {k: f[k] for k in f.files}
+                except (OSError, ValueError, KeyError):
+                    index = build_crs_index()
+                    _save(path, index)
+
+                # Regional presets use their own (tighter) extents
+                for i in np.flatnonzero(np.isin(index["codes"], list(PRESETS))):
+                    index["bounds"][i] = PRESETS[int(index["codes"][i])].bounds
+
+                self._tree = STRtree(shapely.box(*index["bounds"].T))
+                self._index = index
+
+        return self._index
+
+
+def build_crs_index() -> dict:
+    """
+    Area of use of every EPSG CRS, in the CRS's own units.
+    """
+    infos = query_crs_info(
+        auth_name="EPSG",
+        pj_types=[PJType.PROJECTED_CRS, PJType.GEOGRAPHIC_2D_CRS],
+        allow_deprecated=False
+    )
+
+    codes, names, areas, bounds = [], [], [], []
+
+    for info in infos:
+        aou = info.area_of_use
+        if aou is None:
+            continue
+
+        lonlat = (aou.west, aou.south, aou.east, aou.north)
+
+        if info.type == PJType.GEOGRAPHIC_2D_CRS:
+            boxes = [lonlat]
+
+            # Areas crossing the antimeridian: one box per side
+            if aou.west > aou.east:
+                boxes = [
+                    (aou.west, aou.south, 180.0, aou.north),
+                    (-180.0, aou.south, aou.east, aou.north),
+                ]
+        else:
+            try:
+                crs = pyproj.CRS.from_epsg(int(info.code))
+                # Projection only (no datum shift): fast, and the
+                # datum difference is negligible for an extent
+                boxes = [pyproj.Transformer.from_crs(
+                    crs.geodetic_crs, crs, always_xy=True
+                ).transform_bounds(*lonlat, densify_pts=21)]
+            except (pyproj.exceptions.ProjError, pyproj.exceptions.CRSError):
+                continue
+
+        for box in boxes:
+            if not np.isfinite(box).all():
+                continue
+
+            codes.append(int(info.code))
+            names.append(info.name)
+            areas.append(aou.name)
+            bounds.append(box)
+
+    return {
+        "codes": np.array(codes, dtype="int64"),
+        "names": np.array(names, dtype=str),
+        "areas": np.array(areas, dtype=str),
+        "bounds": np.array(bounds, dtype="float64").reshape(-1, 4),
+    }
+
+
+def _save(path: str, index: dict) -> None:
+    """
+    Atomic write; failures only cost a rebuild next time.
+    """
+    tmp = None
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(suffix=".npz", dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **index)
+        os.replace(tmp, path)
+    except (OSError, ValueError):
+        if tmp is not None and os.path.exists(tmp):
+            os.remove(tmp)
+
+
+# Shared suggester: the index is loaded once per process
+_SUGGESTER = CRSSuggester()
+
+
+def suggest_crs(extent, limit: int = 5) -> List[CRSSuggestion]:
+    return _SUGGESTER.suggest(extent, limit=limit)
+
+
+def suggest_crs_for(coordinates, limit: int = 5) -> List[CRSSuggestion]:
+    return _SUGGESTER.suggest_for(coordinates, limit=limit)
@@ -0,0 +1,127 @@
+# Copyright (c) 2026 Jordan Zavaleta
+# This file is part of PyTAB2GIS.
+# PyTAB2GIS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+import shapely
+
+from pytab2gis.crs.crs_manager import get_transformer
+
+
+def reproject_coords(coords: np.ndarray, source, target) -> np.ndarray:
+    """
+    Reprojects an (N, 2) coordinate array in one vectorized
+    ``Transformer.transform`` call.
+
+    ``source``/``target`` are any CRS input accepted by
+    ``crs_manager.crs_key`` (EPSG code, CRS id, pyproj.CRS, ...).
+
+    Raises
+    ------
+    ValueError
+        If some coordinates fall outside the domain of the
+        transformation.
+    """
+    coords = np.asarray(coords, dtype="float64").reshape(-1, 2)
+
+    x, y = get_transformer(source, target).transform(coords[:, 0], coords[:, 1])
+    out = np.column_stack((x, y))
+
+    bad = ~np.isfinite(out).all(axis=1) & np.isfinite(coords).all(axis=1)
+    if bad.any():
+        raise ValueError(
+            f"{int(bad.sum())} vertices could not be reprojected "
+            f"(first at {tuple(coords[np.argmax(bad)].tolist())})."
+        )
+
+    return out
+
+
+def densify_rings(
+    coords: np.ndarray,
+    offsets: np.ndarray,
+    max_length: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Inserts vertices so no ring edge is longer than ``max_length``.
+
+    Rings may be open or explicitly closed; the closing edge of an
+    open ring is densified too (without adding a closing vertex).
+
+    Returns
+    -------
+    (coords, offsets, source)
+        ``source`` gives, per output vertex, the input vertex it
+        comes from, or -1 for inserted vertices.
+    """
+    counts = np.diff(offsets)
+    n = len(coords)
+
+    if n == 0:
+        return coords, offsets, np.arange(0)
+
+    figure = np.repeat(np.arange(len(counts)), counts)
+    last = offsets[1:][counts > 0] - 1
+    first = offsets[:-1][counts > 0]
+
+    # Edge from every vertex to the next one, wrapping around
+    nxt = np.arange(1, n + 1)
+    nxt[last] = first
+
+    closed = np.zeros(n, dtype=bool)
+    closed[last] = (coords[first] == coords[last]).all(axis=1)
+
+    delta = coords[nxt] - coords
+    length = np.hypot(delta[:, 0], delta[:, 1])
+
+    # Pieces per edge; the last vertex of a closed ring has no edge
+    pieces = np.maximum(np.ceil(length / max_length), 1).astype("int64")
+    pieces[closed] = 1
+
+    vertex = np.repeat(np.arange(n), pieces)
+    step = np.arange(len(vertex)) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+    t = step / pieces[vertex]
+
+    out = coords[vertex] + t[:, None] * delta[vertex]
+    source = np.where(step == 0, vertex, -1)
+
+    new_counts = np.bincount(figure, weights=pieces, minlength=len(counts))
+    new_offsets = np.r_[0, np.cumsum(new_counts)].astype("int64")
+
+    return out, new_offsets, source
+
+
+def reproject_geometries(
+    geometries: List[Tuple[str, object]],
+    source,
+    target,
+    densify: Optional[float] = None
+) -> List[Tuple[str, object]]:
+    """
+    Reprojects ``(name, geometry)`` pairs with a single transform
+    over all their coordinates, optionally densifying edges to
+    ``densify`` (source CRS units) first.
+    """
+    geoms = np.array([geom for _, geom in geometries], dtype=object)
+
+    if densify:
+        geoms = shapely.segmentize(geoms, densify)
+
+    geoms = shapely.transform(
+        geoms, lambda xy: reproject_coords(xy, source, target)
+    )
+
+    return [(name, geom) for (name, _), geom in zip(geometries, geoms)]
@@ -17,11 +17,15 @@ import os
 import zipfile
 import shutil
 import tempfile
-from typing import List, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
 import geopandas as gpd
 from shapely.geometry import Polygon
 
+from pytab2gis.crs.crs_manager import resolve_crs
+from pytab2gis.export.manifest import ExportManifest, figure_hash, figure_key
+
 
 # --------------------------------------------------
 # Utils
@@ -35,6 +39,30 @@ def _ensure_dir(path: str):
     os.makedirs(path, exist_ok=True)
 
 
+def _outputs(output_dir: str, fig: str, options: dict) -> List[str]:
+    """
+    Paths produced for one figure under the given export options.
+    """
+    if options["format"] == "GPKG":
+        return [os.path.join(output_dir, f"{fig}.gpkg")]
+
+    if options["zip"]:
+        return [os.path.join(output_dir, f"{fig}.zip")]
+
+    return [os.path.join(output_dir, fig)]
+
+
+@dataclass
+class ExportResult:
+    """
+    Figure names written, skipped (unchanged) and removed
+    (no longer present) by an export.
+    """
+    written: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+
 # --------------------------------------------------
 # Core export
 # --------------------------------------------------
@@ -45,9 +73,19 @@ def export_geometries(
     epsg: int,
     export_format: str,
     export_dxf: bool = False,
-    zip_output: bool = False
-):
+    zip_output: bool = False,
+    crs=None,
+    incremental: bool = False,
+    sources: Optional[List[str]] = None,
+    processed_sources: Optional[List[str]] = None
+) -> ExportResult:
     """
+    epsg:
+        - EPSG code of the geometries
+
+    crs:
+        - optional CRS (pyproj / WKT / PROJ) used instead of epsg
+
     export_format:
         - "SHP"
         - "GPKG"
@@ -58,10 +96,33 @@ def export_geometries(
 
     zip_output:
         - True → outputs zipped per figure
+
+    incremental:
+        - True → a manifest in output_dir records a hash per figure
+          (coordinates, CRS, export options) and per input sheet;
+          unchanged figures are skipped and outputs of figures that
+          disappeared are deleted
+
+    sources:
+        - optional input sheet label per geometry, for the manifest
+
+    processed_sources:
+        - input sheets fully processed by this run; incremental
+          exports only remove outputs of figures from these sheets
+          (default: the sheets in ``sources``)
     """
 
     _ensure_dir(output_dir)
 
+    if crs is None:
+        crs = f"EPSG:{epsg}"
+
+    # Resolved once for the whole export (shared cache) instead of
+    # by every GeoDataFrame; the manifest keeps hashing the CRS as
+    # given, so existing manifests stay valid
+    crs_label = crs
+    crs = resolve_crs(crs)
+
     # 🔑 si es zipped, usamos un directorio temporal
     base_work_dir = (
         tempfile.mkdtemp(prefix="pytab2gis_")
@@ -71,10 +132,35 @@ def export_geometries(
 
     created_folders = []
 
+    result = ExportResult()
+    manifest = ExportManifest.load(output_dir) if incremental else None
+    options = {
+        "format": export_format,
+        "dxf": export_dxf,
+        "zip": zip_output,
+    }
+    figure_sources: Dict[str, List[str]] = {}
+
     try:
-        for name, geom in geometries:
+        for i, (name, geom) in enumerate(geometries):
             fig = _sanitize(name)
 
+            if manifest is not None:
+                source = sources[i] if sources is not None else ""
+                digest = figure_hash(name, geom, crs_label, options)
+                key = figure_key(source, fig)
+                figure_sources.setdefault(source, []).append(key)
+
+                if manifest.is_current(key, digest):
+                    result.skipped.append(name)
+                    continue
+
+                manifest.record(
+                    key, digest, _outputs(output_dir, fig, options), source
+                )
+
+            result.written.append(name)
+
             # -------- GPKG --------
             if export_format == "GPKG":
                 path = os.path.join(output_dir, f"{fig}.gpkg")
@@ -82,7 +168,7 @@ def export_geometries(
                 gdf = gpd.GeoDataFrame(
                     {"name": [name]},
                     geometry=[geom],
-                    crs=f"EPSG:{epsg}"
+                    crs=crs
                 )
                 gdf.to_file(path, driver="GPKG")
                 continue
@@ -97,7 +183,7 @@ def export_geometries(
             gdf_shp = gpd.GeoDataFrame(
                 {"name": [name]},
                 geometry=[geom],
-                crs=f"EPSG:{epsg}"
+                crs=crs
             )
             gdf_shp.to_file(shp_path, driver="ESRI Shapefile")
 
@@ -110,7 +196,7 @@ def export_geometries(
 
                 gdf_dxf = gpd.GeoDataFrame(
                     geometry=[geom],
-                    crs=f"EPSG:{epsg}"
+                    crs=crs
                 )
                 gdf_dxf.to_file(dxf_path, driver="DXF")
 
@@ -130,6 +216,18 @@ def export_geometries(
                         full_path = os.path.join(folder, f)
                         z.write(full_path, arcname=f)
 
+        # -------- MANIFEST --------
+        if manifest is not None:
+            if processed_sources is None:
+                processed_sources = list(figure_sources)
+
+            keep = [k for keys in figure_sources.values() for k in keys]
+            result.removed = manifest.prune(keep, processed_sources)
+            manifest.record_sheets(figure_sources, processed_sources)
+            manifest.save()
+
+        return result
+
     finally:
         # 🧹 limpieza total del temporal
         if zip_output and os.path.isdir(base_work_dir):
@@ -0,0 +1,232 @@
+# Copyright (c) 2026 Jordan Zavaleta
+# This file is part of PyTAB2GIS.
+# PyTAB2GIS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import hashlib
+import json
+import os
+import shutil
+from typing import Dict, Iterable, List, Optional
+
+from pytab2gis.crs.crs_manager import crs_wkt
+
+
+MANIFEST_NAME = ".pytab2gis_manifest.json"
+MANIFEST_VERSION = 2
+
+
+def figure_hash(name: str, geom, crs, options: dict) -> str:
+    """
+    Hash of everything that determines a figure's outputs:
+    name, coordinates (as WKB), CRS and export options.
+    """
+    digest = hashlib.sha256()
+    digest.update(name.encode("utf-8"))
+    digest.update(geom.wkb)
+    digest.update(_crs_key(crs).encode("utf-8"))
+    digest.update(json.dumps(options, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def figure_key(source: Optional[str], fig: str) -> str:
+    """
+    Manifest key of a figure. Sheets often reuse figure names
+    (P0, P1, ...), so entries are qualified by their input sheet.
+    """
+    return f"{source}::{fig}" if source else fig
+
+
+def _crs_key(crs) -> str:
+    # pyproj.CRS → WKT (cached per CRS); "EPSG:x" / PROJ strings as given
+    if hasattr(crs, "to_wkt"):
+        return crs_wkt(crs)
+    return str(crs)
+
+
+class ExportManifest:
+    """
+    Records, per output directory, the hash of every exported
+    figure and input sheet together with the files produced.
+
+    Used by incremental exports to skip unchanged figures and to
+    remove outputs of figures that no longer exist. Figures are
+    keyed by input sheet and name (see ``figure_key``).
+    """
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, MANIFEST_NAME)
+        self.figures: Dict[str, dict] = {}
+        self.sheets: Dict[str, dict] = {}
+
+    # --------------------------------------------------
+    # PERSISTENCE
+    # --------------------------------------------------
+
+    @classmethod
+    def load(cls, output_dir: str) -> "ExportManifest":
+        manifest = cls(output_dir)
+
+        try:
+            with open(manifest.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return manifest
+
+        # Unknown layout: start over (everything is re-exported)
+        if data.get("version") != MANIFEST_VERSION:
+            return manifest
+
+        manifest.figures = data.get("figures", {})
+        manifest.sheets = data.get("sheets", {})
+        return manifest
+
+    def save(self) -> None:
+        tmp_path = self.path + ".tmp"
+
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": MANIFEST_VERSION,
+                    "sheets": self.sheets,
+                    "figures": self.figures,
+                },
+                f,
+                indent=1,
+                sort_keys=True
+            )
+
+        os.replace(tmp_path, self.path)
+
+    # --------------------------------------------------
+    # FIGURES
+    # --------------------------------------------------
+
+    def is_current(self, key: str, digest: str) -> bool:
+        """
+        True if the figure was exported with the same hash and all
+        of its outputs are still on disk.
+        """
+        entry = self.figures.get(key)
+
+        if entry is None or entry.get("hash") != digest:
+            return False
+
+        return all(
+            os.path.exists(os.path.join(self.output_dir, p))
+            for p in entry.get("outputs", [])
+        )
+
+    def record(
+        self,
+        key: str,
+        digest: str,
+        outputs: Iterable[str],
+        source: Optional[str] = None
+    ) -> None:
+        """
+        Records a (re-)exported figure. Outputs it had under
+        previous export options are deleted.
+        """
+        outputs = sorted(
+            os.path.relpath(p, self.output_dir) for p in outputs
+        )
+
+        previous = self.figures.pop(key, {}).get("outputs", [])
+        self._remove_outputs(p for p in previous if p not in outputs)
+
+        self.figures[key] = {
+            "hash": digest,
+            "outputs": outputs,
+            "source": source,
+        }
+
+    def prune(self, keep: Iterable[str], sources: Iterable[str]) -> List[str]:
+        """
+        Deletes the outputs of figures not in ``keep`` and drops
+        their entries, restricted to figures of ``sources`` (the
+        sheets fully processed by this run; merged figures match any
+        of their sheets): figures of sheets that were not selected
+        or failed are left alone. Only files
+        listed in the manifest are touched. Returns the removed
+        figure keys.
+        """
+        keep = set(keep)
+        sources = set(sources)
+        removed = [
+            k for k, entry in self.figures.items()
+            if k not in keep and _split_sources(entry.get("source")) & sources
+        ]
+
+        for key in removed:
+            self._remove_outputs(self.figures.pop(key).get("outputs", []))
+
+        return removed
+
+    def _remove_outputs(self, outputs: Iterable[str]) -> None:
+        # Same-named figures of different sheets share output paths;
+        # never delete a file another entry still owns
+        claimed = {
+            p for entry in self.figures.values()
+            for p in entry.get("outputs", [])
+        }
+
+        for rel in outputs:
+            if rel in claimed:
+                continue
+
+            path = os.path.join(self.output_dir, rel)
+
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            elif os.path.exists(path):
+                os.remove(path)
+
+    # --------------------------------------------------
+    # SHEETS
+    # --------------------------------------------------
+
+    def record_sheets(
+        self,
+        figure_sources: Dict[str, List[str]],
+        sources: Iterable[str] = ()
+    ) -> None:
+        """
+        Updates the per-sheet section from the figure hashes: one
+        hash per input sheet over its figure keys, in order. Sheets
+        in ``sources`` without figures are dropped; sheets not
+        processed by this run keep their previous entry.
+        """
+        sources = set(sources)
+        for source in list(self.sheets):
+            if _split_sources(source) & sources:
+                del self.sheets[source]
+
+        for source, keys in figure_sources.items():
+            digest = hashlib.sha256()
+            for key in keys:
+                digest.update(self.figures[key]["hash"].encode("ascii"))
+
+            self.sheets[source] = {
+                "hash": digest.hexdigest(),
+                "figures": list(keys),
+            }
+
+
+def _split_sources(source: Optional[str]) -> set:
+    """
+    Input sheets of a manifest source label. Figures merged by
+    ``Deduplicator`` carry every sheet of the group, joined by ";".
+    """
+    return set((source or "").split(";"))
@@ -0,0 +1,213 @@
+# Copyright (c) 2026 Jordan Zavaleta
+# This file is part of PyTAB2GIS.
+# PyTAB2GIS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import shapely
+
+from pytab2gis.figures.figure_collection import FigureCollection
+
+
+# What to do with duplicates
+DUPLICATE_POLICIES = ("skip", "merge", "report")
+
+
+def canonical_hashes(geometries: Sequence, tolerance: float = 0.0) -> np.ndarray:
+    """
+    Canonical hash per geometry (None for missing geometries).
+
+    Coordinates are snapped to a ``tolerance`` grid (when > 0),
+    then ``shapely.normalize`` fixes ring orientation, start
+    vertex and part order, so copies digitized with another winding
+    or start vertex hash the same. Copies within the tolerance may
+    still differ when a coordinate falls on either side of a grid
+    line.
+    """
+    geoms = np.asarray(geometries, dtype=object)
+
+    if tolerance > 0:
+        geoms = shapely.set_precision(geoms, tolerance, mode="pointwise")
+
+    wkb = shapely.to_wkb(shapely.normalize(geoms))
+
+    return np.array(
+        [
+            None if b is None
+            else hashlib.blake2b(b, digest_size=16).hexdigest()
+            for b in wkb
+        ],
+        dtype=object
+    )
+
+
+@dataclass
+class DuplicateReport:
+    """
+    Duplicate groups found by ``Deduplicator.find``.
+
+    ``keep`` holds, per figure, the position of the first figure
+    with the same canonical hash (its own position when unique);
+    ``duplicate`` flags the later copies.
+    """
+    names: np.ndarray
+    sources: np.ndarray
+    keep: np.ndarray
+    duplicate: np.ndarray
+
+    def __len__(self):
+        return int(self.duplicate.sum())
+
+    def groups(self) -> Dict[int, List[int]]:
+        """
+        ``{kept position: [copy positions]}`` for groups with copies.
+        """
+        groups: Dict[int, List[int]] = {}
+        for i in np.flatnonzero(self.duplicate):
+            groups.setdefault(int(self.keep[i]), []).append(int(i))
+        return groups
+
+    def summary(self) -> str:
+        return (
+            f"{len(self)} duplicate(s) of "
+            f"{len(self.groups())} figure(s)"
+        )
+
+    def messages(self) -> Iterator[str]:
+        for first, copies in self.groups().items():
+            yield (
+                f"Figure {self._label(first)} is duplicated by "
+                + ", ".join(self._label(i) for i in copies)
+                + "."
+            )
+
+    def _label(self, i: int) -> str:
+        source = self.sources[i]
+        return f"'{self.names[i]}'" + (f" [{source}]" if source else "")
+
+
+class Deduplicator:
+    """
+    Finds figures with the same canonical geometry hash (see
+    ``canonical_hashes``) and applies a duplicate policy:
+
+    - skip   : keep the first copy only
+    - merge  : keep the first copy, named after all distinct names
+               of the group (and sources, for collections)
+    - report : keep every copy; duplicates are only reported
+    """
+
+    def __init__(self, policy: str = "report", tolerance: float = 0.0):
+        if policy not in DUPLICATE_POLICIES:
+            raise ValueError(
+                f"Unknown duplicate policy '{policy}'. "
+                f"Expected one of: {', '.join(DUPLICATE_POLICIES)}"
+            )
+
+        self.policy = policy
+        self.tolerance = tolerance
+
+    # --------------------------------------------------
+    # PUBLIC API
+    # --------------------------------------------------
+
+    def find(self, geometries: Sequence, names, sources=None) -> DuplicateReport:
+        hashes = canonical_hashes(geometries, self.tolerance)
+        codes, _ = pd.factorize(hashes)
+
+        # First position of every hash (missing geometries are unique)
+        positions = np.arange(len(codes))
+        known = codes >= 0
+        _, first = np.unique(codes[known], return_index=True)
+
+        # Codes are dense (0..k-1), so they index ``first`` directly
+        keep = positions.copy()
+        keep[known] = positions[known][first][codes[known]]
+
+        names = np.asarray(names, dtype=object)
+
+        return DuplicateReport(
+            names=names,
+            sources=(
+                np.full(len(names), None, dtype=object) if sources is None
+                else np.asarray(sources, dtype=object)
+            ),
+            keep=keep,
+            duplicate=keep != positions,
+        )
+
+    def apply(
+        self,
+        collection: FigureCollection
+    ) -> Tuple[FigureCollection, DuplicateReport]:
+        report = self.find(
+            collection.to_shapely(), collection.names, collection.sources
+        )
+
+        if self.policy == "report" or not len(report):
+            return collection, report
+
+        result = collection.select(~report.duplicate)
+
+        if self.policy == "merge":
+            # Positions of the kept figures inside the result
+            position = np.cumsum(~report.duplicate) - 1
+
+            for first, copies in report.groups().items():
+                group = [first] + copies
+                result.names[position[first]] = _join(collection.names[group], "+")
+                result.sources[position[first]] = _join(collection.sources[group], ";")
+
+        return result, report
+
+    def apply_geometries(
+        self,
+        geometries: List[Tuple[str, object]]
+    ) -> Tuple[List[Tuple[str, object]], DuplicateReport]:
+        """
+        Same as ``apply`` for ``(name, geometry)`` lists such as the
+        output of ``build_geometries_from_table``.
+        """
+        report = self.find(
+            [geom for _, geom in geometries],
+            [name for name, _ in geometries]
+        )
+
+        if self.policy == "report" or not len(report):
+            return geometries, report
+
+        names = {}
+        if self.policy == "merge":
+            for first, copies in report.groups().items():
+                names[first] = _join(report.names[[first] + copies], "+")
+
+        result = [
+            (names.get(i, name), geom)
+            for i, (name, geom) in enumerate(geometries)
+            if not report.duplicate[i]
+        ]
+
+        return result, report
+
+
+def _join(values, sep: str):
+    """
+    Distinct non-empty values in order, joined by ``sep``.
+    """
+    distinct = list(dict.fromkeys(str(v) for v in values if v))
+    return sep.join(distinct) if distinct else None
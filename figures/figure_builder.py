@@ -13,14 +13,15 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import List, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
-import pandas as pd
+import numpy as np
 
 from pytab2gis.table.column_finder import ColumnFinder
 from pytab2gis.table.table_detector import TableBlock
 from pytab2gis.figures.figure_model import Figure
-from pytab2gis.crs.crs_manager import CRSManager
+from pytab2gis.figures.figure_collection import FigureCollection
+from pytab2gis.crs.crs_manager import CRSManager, register_crs_manager
 
 
 class FigureBuilder:
@@ -40,13 +41,20 @@ class FigureBuilder:
     # PUBLIC API
     # --------------------------------------------------
 
-    def build(self, block: TableBlock) -> Figure:
+    def build(
+        self,
+        block: TableBlock,
+        xy_columns: Optional[Tuple[str, str]] = None
+    ) -> Figure:
         """
         Builds a Figure from a TableBlock.
 
         Parameters
         ----------
         block : TableBlock
+        xy_columns : (x_column, y_column), optional
+            Coordinate columns already resolved for the sheet.
+            Detected from the block header when omitted.
 
         Returns
         -------
@@ -57,23 +65,23 @@ class FigureBuilder:
         ValueError
             If the table block cannot produce a valid Figure.
         """
-        df = block.rows.copy()
-
-        # Detect X/Y columns
-        finder = ColumnFinder(df)
-        x_col, y_col = finder.find_xy_columns()
+        # Detect X/Y columns (header only, no row data needed)
+        x_col, y_col = xy_columns or ColumnFinder(block.columns).find_xy_columns()
 
-        # Extract coordinates
-        vertices = self._extract_vertices(df, x_col, y_col)
+        # Extract coordinates from the block's column views
+        coords, mask = self._extract_vertices(block, x_col, y_col)
 
         # Instantiate Figure
         figure = Figure(
             name=block.name,
-            vertices=vertices,
+            vertices=coords,
             crs_manager=self.crs_manager,
             table_id=block.table_id
         )
 
+        # Rows skipped for lack of numeric coordinates
+        figure.metadata["dropped_rows"] = int(len(mask) - mask.sum())
+
         # Validate figure
         errors = figure.validate()
         if errors:
@@ -83,34 +91,139 @@ class FigureBuilder:
 
         return figure
 
+    def build_many(
+        self,
+        blocks: Iterable[TableBlock],
+        xy_columns: Optional[Tuple[str, str]] = None
+    ) -> FigureCollection:
+        """
+        Builds all figures of a batch of TableBlocks at once.
+
+        Vertices are gathered into a single coordinate array; blocks
+        that cannot produce a valid figure do not raise but are
+        listed in ``rejected`` as ``(name, message)`` pairs.
+
+        Parameters
+        ----------
+        blocks : iterable of TableBlock
+        xy_columns : (x_column, y_column), optional
+            Coordinate columns already resolved for the sheet.
+            Otherwise they are detected once per distinct header.
+
+        Returns
+        -------
+        FigureCollection
+        """
+        crs_id = register_crs_manager(self.crs_manager)
+
+        names, table_ids, dropped = [], [], []
+        coords, rows = [], []
+        rejected = []
+        resolved: Dict[tuple, object] = {}
+
+        for block in blocks:
+            if xy_columns is not None:
+                x_col, y_col = xy_columns
+            else:
+                xy = _resolve_xy(block.columns, resolved)
+
+                if isinstance(xy, ValueError):
+                    rejected.append((block.name, f"{xy}"))
+                    continue
+
+                x_col, y_col = xy
+
+            xy, mask = self._extract_vertices(block, x_col, y_col)
+
+            names.append(block.name)
+            table_ids.append(block.table_id)
+            dropped.append(len(mask) - int(mask.sum()))
+            coords.append(xy)
+            rows.append(np.asarray(block.index, dtype=object)[mask])
+
+        if not names:
+            collection = FigureCollection.empty(crs_id)
+            collection.rejected = rejected
+            return collection
+
+        counts = np.fromiter(map(len, coords), dtype="int64", count=len(coords))
+
+        collection = FigureCollection(
+            coords=np.concatenate(coords),
+            offsets=np.r_[0, np.cumsum(counts)],
+            names=names,
+            crs_id=crs_id,
+            table_ids=table_ids,
+            dropped=dropped,
+            row_index=np.concatenate(rows),
+        )
+
+        # Vertices are finite by construction: only the name and the
+        # vertex count can make a figure invalid
+        valid = (counts >= 3) & np.fromiter(
+            (bool(n) and bool(str(n).strip()) for n in names),
+            dtype=bool,
+            count=len(names)
+        )
+
+        if valid.all():
+            collection.rejected = rejected
+            return collection
+
+        for i in np.flatnonzero(~valid):
+            errors = collection[i].validate()
+            rejected.append((
+                names[i], f"Invalid figure '{names[i]}': " + "; ".join(errors)
+            ))
+
+        collection = collection.select(valid)
+        collection.rejected = rejected
+
+        return collection
+
     # --------------------------------------------------
     # INTERNAL HELPERS
     # --------------------------------------------------
 
     def _extract_vertices(
         self,
-        df: pd.DataFrame,
+        block: TableBlock,
         x_col: str,
         y_col: str
-    ) -> List[Tuple[float, float]]:
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Extracts numeric vertex coordinates from the table.
+        Extracts numeric vertex coordinates from the table block
+        with column-level numeric conversion.
 
-        Non-numeric or missing values are skipped.
+        Returns
+        -------
+        (coords, mask)
+            ``coords`` is a contiguous (N, 2) float64 array of the
+            kept vertices; ``mask`` flags, per block row, whether
+            the row was kept. Non-numeric or missing values are
+            dropped.
         """
-        vertices: List[Tuple[float, float]] = []
+        xs = block.numeric_column(x_col)
+        ys = block.numeric_column(y_col)
+
+        mask = np.isfinite(xs) & np.isfinite(ys)
+        coords = np.column_stack((xs[mask], ys[mask]))
+
+        return coords, mask
 
-        for idx, row in df.iterrows():
-            x = row.get(x_col)
-            y = row.get(y_col)
 
-            try:
-                x_val = float(x)
-                y_val = float(y)
-            except (TypeError, ValueError):
-                # Skip rows without valid numeric coordinates
-                continue
 
-            vertices.append((x_val, y_val))
+def _resolve_xy(columns, resolved: dict):
+    """
+    X/Y columns of a header, or the ValueError explaining why they
+    cannot be found. Memoized in ``resolved`` by header.
+    """
+    key = tuple(columns)
+
+    if key not in resolved:
+        try:
+            resolved[key] = ColumnFinder(columns).find_xy_columns()
+        except ValueError as e:
+            resolved[key] = e
 
-        return vertices
+    return resolved[key]
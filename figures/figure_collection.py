@@ -0,0 +1,299 @@
+# Copyright (c) 2026 Jordan Zavaleta
+# This file is part of PyTAB2GIS.
+# PyTAB2GIS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import shapely
+
+from pytab2gis.figures.figure_model import Figure
+from pytab2gis.crs.crs_manager import get_crs_manager
+from pytab2gis.crs.reprojection import densify_rings, reproject_coords
+
+
+class FigureCollection:
+    """
+    Columnar batch of figures sharing one CRS.
+
+    All vertices live in one (M, 2) float64 ``coords`` array; figure
+    ``i`` spans ``coords[offsets[i]:offsets[i + 1]]``. Per-figure
+    attributes are parallel arrays, so checks, reprojection and
+    export can run on the whole batch at once.
+
+    Attributes
+    ----------
+    coords : (M, 2) float64 array
+    offsets : (n + 1,) int64 array
+    names, table_ids, sources : (n,) object arrays
+    dropped : (n,) int64 array
+        Source rows skipped for lack of numeric coordinates.
+    row_index : (M,) object array or None
+        Source row label of every vertex (pointer back to the sheet).
+    crs_id : str
+    rejected : list of (name, message)
+        Blocks that could not produce a valid figure.
+    """
+
+    def __init__(
+        self,
+        coords: np.ndarray,
+        offsets: np.ndarray,
+        names: Sequence[str],
+        crs_id: str,
+        table_ids: Optional[Sequence] = None,
+        sources: Optional[Sequence] = None,
+        dropped: Optional[Sequence[int]] = None,
+        row_index: Optional[Sequence] = None,
+        rejected: Optional[List[Tuple[str, str]]] = None
+    ):
+        n = len(names)
+
+        self.coords = np.ascontiguousarray(coords, dtype="float64").reshape(-1, 2)
+        self.offsets = np.asarray(offsets, dtype="int64")
+        self.names = _object_array(names, n)
+        self.table_ids = _object_array(table_ids, n)
+        self.sources = _object_array(sources, n)
+        self.dropped = (
+            np.zeros(n, dtype="int64") if dropped is None
+            else np.asarray(dropped, dtype="int64")
+        )
+        self.row_index = (
+            None if row_index is None else _object_array(row_index, len(self.coords))
+        )
+        self.crs_id = crs_id
+        self.rejected = list(rejected or [])
+
+        if len(self.offsets) != n + 1 or self.offsets[-1] != len(self.coords):
+            raise ValueError("Offsets do not match names and coordinates.")
+
+    # --------------------------------------------------
+    # CONSTRUCTION
+    # --------------------------------------------------
+
+    @classmethod
+    def empty(cls, crs_id: str) -> "FigureCollection":
+        return cls(np.empty((0, 2)), np.zeros(1, dtype="int64"), [], crs_id)
+
+    @classmethod
+    def from_figures(cls, figures: Sequence[Figure]) -> "FigureCollection":
+        if not figures:
+            raise ValueError("Cannot infer the CRS of an empty figure list.")
+
+        counts = [len(f.vertices) for f in figures]
+
+        return cls(
+            coords=np.concatenate([f.vertices for f in figures]),
+            offsets=np.r_[0, np.cumsum(counts)],
+            names=[f.name for f in figures],
+            crs_id=figures[0].crs_id,
+            table_ids=[f.table_id for f in figures],
+            sources=[f.source for f in figures],
+            dropped=[f.metadata.get("dropped_rows", 0) for f in figures],
+        )
+
+    @classmethod
+    def concat(
+        cls,
+        collections: Iterable["FigureCollection"],
+        crs_id: Optional[str] = None
+    ) -> "FigureCollection":
+        collections = list(collections)
+
+        if not collections:
+            if crs_id is None:
+                raise ValueError("Cannot infer the CRS of an empty batch.")
+            return cls.empty(crs_id)
+
+        crs_ids = {c.crs_id for c in collections}
+        if len(crs_ids) > 1:
+            raise ValueError(f"Cannot concatenate different CRSs: {crs_ids}")
+
+        counts = np.concatenate([c.vertex_counts for c in collections])
+        with_rows = all(c.row_index is not None for c in collections)
+
+        return cls(
+            coords=np.concatenate([c.coords for c in collections]),
+            offsets=np.r_[0, np.cumsum(counts)],
+            names=np.concatenate([c.names for c in collections]),
+            crs_id=collections[0].crs_id,
+            table_ids=np.concatenate([c.table_ids for c in collections]),
+            sources=np.concatenate([c.sources for c in collections]),
+            dropped=np.concatenate([c.dropped for c in collections]),
+            row_index=(
+                np.concatenate([c.row_index for c in collections])
+                if with_rows else None
+            ),
+            rejected=[r for c in collections for r in c.rejected],
+        )
+
+    # --------------------------------------------------
+    # ACCESS
+    # --------------------------------------------------
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[Figure]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, i: int) -> Figure:
+        """
+        Figure view of item ``i`` (vertices are not copied).
+        """
+        start, stop = self.offsets[i], self.offsets[i + 1]
+
+        return Figure(
+            name=self.names[i],
+            vertices=self.coords[start:stop],
+            crs_id=self.crs_id,
+            source=self.sources[i],
+            table_id=self.table_ids[i],
+            metadata={"dropped_rows": int(self.dropped[i])}
+        )
+
+    @property
+    def vertex_counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    @property
+    def figure_ids(self) -> np.ndarray:
+        """
+        Figure position of every vertex.
+        """
+        return np.repeat(np.arange(len(self)), self.vertex_counts)
+
+    def select(self, which) -> "FigureCollection":
+        """
+        Sub-collection from a boolean mask or integer indices.
+        """
+        idx = np.arange(len(self))[which]
+        starts = self.offsets[idx]
+        counts = self.vertex_counts[idx]
+
+        # Vertex positions of the selected figures, in order
+        take = np.repeat(starts - np.r_[0, np.cumsum(counts)[:-1]], counts) \
+            + np.arange(counts.sum())
+
+        return FigureCollection(
+            coords=self.coords[take],
+            offsets=np.r_[0, np.cumsum(counts)],
+            names=self.names[idx],
+            crs_id=self.crs_id,
+            table_ids=self.table_ids[idx],
+            sources=self.sources[idx],
+            dropped=self.dropped[idx],
+            row_index=None if self.row_index is None else self.row_index[take],
+            rejected=self.rejected,
+        )
+
+    # --------------------------------------------------
+    # REPROJECTION
+    # --------------------------------------------------
+
+    def to_crs(
+        self,
+        target: Union[int, str],
+        densify: Optional[float] = None
+    ) -> "FigureCollection":
+        """
+        Copy of the collection in another CRS.
+
+        All vertices are transformed in one vectorized call. With
+        ``densify``, edges are first split so none is longer than
+        that length (source CRS units), keeping straight edges
+        faithful after projection. Inserted vertices have no source
+        row (``row_index`` None).
+
+        Parameters
+        ----------
+        target : int or str
+            EPSG code or CRS id ("EPSG:4326", "PROJ:...").
+        densify : float, optional
+        """
+        target_id = target if isinstance(target, str) else f"EPSG:{int(target)}"
+        target_crs = get_crs_manager(target_id).crs
+        source_crs = get_crs_manager(self.crs_id).crs
+
+        coords, offsets, row_index = self.coords, self.offsets, self.row_index
+
+        if densify:
+            coords, offsets, source = densify_rings(coords, offsets, densify)
+
+            if row_index is not None:
+                row_index = np.where(source >= 0, row_index[source], None)
+
+        return FigureCollection(
+            coords=reproject_coords(coords, source_crs, target_crs),
+            offsets=offsets,
+            names=self.names,
+            crs_id=target_id,
+            table_ids=self.table_ids,
+            sources=self.sources,
+            dropped=self.dropped,
+            row_index=row_index,
+            rejected=self.rejected,
+        )
+
+    # --------------------------------------------------
+    # GEOMETRY
+    # --------------------------------------------------
+
+    def is_closed(self) -> np.ndarray:
+        """
+        Per-figure flag: first vertex equals last vertex.
+        """
+        counts = self.vertex_counts
+        closed = np.zeros(len(self), dtype=bool)
+
+        has = counts >= 2
+        first = self.coords[self.offsets[:-1][has]]
+        last = self.coords[self.offsets[1:][has] - 1]
+        closed[has] = (first == last).all(axis=1)
+
+        return closed
+
+    def to_shapely(self) -> np.ndarray:
+        """
+        One Polygon per figure, built in a single vectorized call
+        (rings are closed automatically). Figures with fewer than
+        three vertices give None.
+        """
+        geoms = np.full(len(self), None, dtype=object)
+        ok = self.vertex_counts >= 3
+
+        if ok.any():
+            sub = self if ok.all() else self.select(ok)
+            rings = shapely.linearrings(sub.coords, indices=sub.figure_ids)
+            geoms[ok] = shapely.polygons(rings)
+
+        return geoms
+
+    def to_geometries(self) -> List[Tuple[str, object]]:
+        """
+        ``(name, Polygon)`` pairs, as taken by ``export_geometries``.
+        """
+        return [
+            (str(name), geom)
+            for name, geom in zip(self.names, self.to_shapely())
+            if geom is not None
+        ]
+
+
+def _object_array(values, n: int) -> np.ndarray:
+    out = np.empty(n, dtype=object)
+    if values is not None:
+        out[:] = list(values)
+    return out
@@ -13,16 +13,23 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Dict
 
-from pytab2gis.crs.crs_manager import CRSManager
+import numpy as np
+
+from pytab2gis.crs.crs_manager import (
+    CRSManager,
+    get_crs_manager,
+    register_crs_manager,
+)
 
 
 Coordinate = Tuple[float, float]
 
+# Max. per-vertex messages reported by validate()
+_MAX_VERTEX_ERRORS = 5
+
 
-@dataclass
 class Figure:
     """
     Represents a spatial figure defined by ordered vertices.
@@ -30,15 +37,87 @@ class Figure:
     A Figure is a CRS-aware spatial entity, independent of input format
     (Excel, image, etc.). Geometry construction and GIS export are handled
     in later stages of the pipeline.
-    """
 
-    name: str
-    vertices: List[Coordinate]
-    crs_manager: CRSManager
+    Vertices are stored as a contiguous (N, 2) float64 array and the
+    CRS as a shared id (see ``crs_manager.get_crs_manager``), so a
+    figure costs 16 bytes per vertex plus a small fixed overhead.
+    """
 
-    source: Optional[str] = None
-    table_id: Optional[str] = None
-    metadata: Dict = field(default_factory=dict)
+    __slots__ = (
+        "name",
+        "vertices",
+        "crs_id",
+        "source",
+        "table_id",
+        "_metadata",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        vertices,
+        crs_manager: Optional[CRSManager] = None,
+        source: Optional[str] = None,
+        table_id: Optional[str] = None,
+        metadata: Optional[Dict] = None,
+        crs_id: Optional[str] = None
+    ):
+        """
+        Parameters
+        ----------
+        vertices : (N, 2) array-like
+            Ordered (x, y) coordinates.
+        crs_manager, crs_id :
+            CRS of the vertices; one of them is required.
+
+        Raises
+        ------
+        ValueError
+            If vertices cannot be read as numeric (x, y) pairs.
+        """
+        try:
+            vertices = np.ascontiguousarray(vertices, dtype="float64")
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid coordinate format: {e}")
+
+        if vertices.size == 0:
+            vertices = vertices.reshape(0, 2)
+
+        if vertices.ndim != 2 or vertices.shape[1] != 2:
+            raise ValueError(
+                f"Invalid coordinate format: expected (N, 2), "
+                f"got {vertices.shape}"
+            )
+
+        if crs_manager is not None:
+            crs_id = register_crs_manager(crs_manager)
+
+        if crs_id is None:
+            raise ValueError("Figure requires a CRS (crs_manager or crs_id).")
+
+        self.name = name
+        self.vertices = vertices
+        self.crs_id = crs_id
+        self.source = source
+        self.table_id = table_id
+        self._metadata = metadata
+
+    @property
+    def crs_manager(self) -> CRSManager:
+        return get_crs_manager(self.crs_id)
+
+    @property
+    def metadata(self) -> Dict:
+        # Created on first use: most figures never carry metadata
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def __repr__(self):
+        return self.summary()
 
     # --------------------------------------------------
     # BASIC VALIDATION
@@ -58,21 +137,28 @@ class Figure:
         if not self.name or not self.name.strip():
             errors.append("Figure name is missing or empty.")
 
-        if not self.vertices:
+        n = len(self.vertices)
+
+        if n == 0:
             errors.append("Figure has no vertices.")
 
-        if self.vertices and len(self.vertices) < 3:
+        if 0 < n < 3:
             errors.append("A figure must have at least three vertices.")
 
-        # Coordinate type checks
-        for i, v in enumerate(self.vertices):
-            if not isinstance(v, tuple) or len(v) != 2:
-                errors.append(f"Invalid coordinate format at index {i}: {v}")
-                continue
+        # Coordinate checks (vectorized)
+        bad = np.flatnonzero(~np.isfinite(self.vertices).all(axis=1))
+
+        for i in bad[:_MAX_VERTEX_ERRORS]:
+            errors.append(
+                f"Non-numeric coordinate at index {i}: "
+                f"{tuple(self.vertices[i].tolist())}"
+            )
 
-            x, y = v
-            if not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
-                errors.append(f"Non-numeric coordinate at index {i}: {v}")
+        if len(bad) > _MAX_VERTEX_ERRORS:
+            errors.append(
+                f"... and {len(bad) - _MAX_VERTEX_ERRORS} more "
+                "non-numeric coordinates."
+            )
 
         return errors
 
@@ -105,15 +191,15 @@ class Figure:
         """
         if len(self.vertices) < 2:
             return False
-        return self.vertices[0] == self.vertices[-1]
+        return bool(np.array_equal(self.vertices[0], self.vertices[-1]))
 
     def close(self) -> None:
         """
         Closes the figure by appending the first vertex at the end
         if not already closed.
         """
-        if not self.is_closed() and self.vertices:
-            self.vertices.append(self.vertices[0])
+        if not self.is_closed() and len(self.vertices):
+            self.vertices = np.vstack((self.vertices, self.vertices[:1]))
 
     # --------------------------------------------------
     # INFO
@@ -126,5 +212,5 @@ class Figure:
         return (
             f"Figure(name='{self.name}', "
             f"vertices={len(self.vertices)}, "
-            f"CRS={self.crs_manager.summary()})"
+            f"CRS={self.crs_id})"
         )
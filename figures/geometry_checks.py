@@ -13,11 +13,74 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import List
+from dataclasses import dataclass
+from typing import Iterator, List
+
+import numpy as np
+import shapely
 from shapely.geometry import Polygon
 from shapely.validation import explain_validity
 
 from pytab2gis.figures.figure_model import Figure
+from pytab2gis.figures.figure_collection import FigureCollection
+
+
+@dataclass
+class GeometryDiagnostics:
+    """
+    Per-figure results of ``GeometryChecker.check_many``.
+
+    Every field is an array with one entry per figure of the
+    checked collection. ``area`` is NaN and ``valid`` is False for
+    figures with fewer than three vertices; ``reason`` holds the
+    validity explanation of invalid polygons only (None elsewhere).
+    """
+    names: np.ndarray
+    too_few_vertices: np.ndarray
+    not_closed: np.ndarray
+    area: np.ndarray
+    small_area: np.ndarray
+    valid: np.ndarray
+    reason: np.ndarray
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def has_issues(self) -> np.ndarray:
+        return (
+            self.too_few_vertices
+            | self.not_closed
+            | self.small_area
+            | ~self.valid
+        )
+
+    def messages(self) -> Iterator[str]:
+        """
+        Same messages as ``GeometryChecker.check``, in figure order,
+        for figures with issues only.
+        """
+        for i in np.flatnonzero(self.has_issues):
+            name = self.names[i]
+
+            if self.too_few_vertices[i]:
+                yield f"Figure '{name}' has fewer than 3 vertices."
+                continue
+
+            if self.not_closed[i]:
+                yield (
+                    f"Figure '{name}' is not closed. "
+                    "It will be closed automatically."
+                )
+
+            if self.small_area[i]:
+                yield (
+                    f"Figure '{name}' has zero or negligible area "
+                    f"(area={self.area[i]})."
+                )
+
+            if not self.valid[i]:
+                yield f"Figure '{name}' has invalid geometry: {self.reason[i]}"
 
 
 class GeometryChecker:
@@ -89,3 +152,45 @@ class GeometryChecker:
             )
 
         return messages
+
+    def check_many(self, collection: FigureCollection) -> GeometryDiagnostics:
+        """
+        Runs the geometry checks on a whole FigureCollection.
+
+        Polygons are built in one vectorized call and area and
+        validity are computed as arrays; validity reasons are only
+        computed for the invalid subset. Figures are not modified
+        (open rings are closed on the fly by the polygon builder).
+
+        Returns
+        -------
+        GeometryDiagnostics
+        """
+        n = len(collection)
+
+        too_few = collection.vertex_counts < 3
+        not_closed = ~collection.is_closed() & ~too_few
+
+        polygons = collection.to_shapely()
+
+        area = np.full(n, np.nan)
+        valid = np.zeros(n, dtype=bool)
+        reason = np.full(n, None, dtype=object)
+
+        built = ~too_few
+        area[built] = shapely.area(polygons[built])
+        valid[built] = shapely.is_valid(polygons[built])
+
+        invalid = built & ~valid
+        if invalid.any():
+            reason[invalid] = shapely.is_valid_reason(polygons[invalid])
+
+        return GeometryDiagnostics(
+            names=collection.names,
+            too_few_vertices=too_few,
+            not_closed=not_closed,
+            area=area,
+            small_area=built & (area <= self.min_area),
+            valid=valid,
+            reason=reason,
+        )
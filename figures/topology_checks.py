@@ -0,0 +1,193 @@
+# Copyright (c) 2026 Jordan Zavaleta
+# This file is part of PyTAB2GIS.
+# PyTAB2GIS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from dataclasses import dataclass
+from typing import Dict, Iterator
+
+import numpy as np
+import shapely
+from shapely import STRtree
+
+from pytab2gis.figures.figure_collection import FigureCollection
+
+
+# Pair classifications, in reporting order
+PAIR_KINDS = ("duplicate", "overlap", "sliver", "gap")
+
+
+@dataclass
+class TopologyReport:
+    """
+    Figure pairs found by ``TopologyChecker.check``.
+
+    ``first``/``second`` are figure positions in the checked
+    collection (``first < second``); ``kind`` is one of PAIR_KINDS.
+    ``overlap_area`` is the shared area (0 for gaps), ``iou`` the
+    intersection over union and ``distance`` the gap width (0 for
+    intersecting pairs). ``skipped`` counts figures left out of the
+    check because their polygon is missing or invalid.
+    """
+    names: np.ndarray
+    sources: np.ndarray
+    first: np.ndarray
+    second: np.ndarray
+    kind: np.ndarray
+    overlap_area: np.ndarray
+    iou: np.ndarray
+    distance: np.ndarray
+    skipped: int = 0
+
+    def __len__(self):
+        return len(self.first)
+
+    def counts(self) -> Dict[str, int]:
+        return {k: int((self.kind == k).sum()) for k in PAIR_KINDS}
+
+    def summary(self) -> str:
+        counts = self.counts()
+        text = ", ".join(f"{k}s: {counts[k]}" for k in PAIR_KINDS)
+
+        if self.skipped:
+            text += f" ({self.skipped} invalid figures not checked)"
+
+        return text
+
+    def messages(self) -> Iterator[str]:
+        for i, j, kind, area, iou, dist in zip(
+            self.first, self.second, self.kind,
+            self.overlap_area, self.iou, self.distance
+        ):
+            pair = f"{self._label(i)} and {self._label(j)}"
+
+            if kind == "duplicate":
+                yield f"Near-duplicate figures {pair} (IoU={iou:.4f})."
+            elif kind == "gap":
+                yield f"Gap between figures {pair} (distance={dist:g})."
+            else:
+                yield f"{kind.capitalize()} between figures {pair} (area={area:g})."
+
+    def _label(self, i: int) -> str:
+        source = self.sources[i]
+        return f"'{self.names[i]}'" + (f" [{source}]" if source else "")
+
+
+class TopologyChecker:
+    """
+    Collection-level checks between figures.
+
+    Candidate pairs come from an STRtree query (O(n log n)) instead
+    of comparing every pair. Intersecting pairs are classified as:
+
+    - duplicate : intersection over union >= ``duplicate_iou``
+    - sliver    : shared area below ``sliver_ratio`` of the smaller
+                  figure (typically digitizing noise along a border)
+    - overlap   : any other positive shared area
+
+    Disjoint pairs closer than ``gap_tolerance`` are reported as
+    gaps (disabled when 0).
+    """
+
+    def __init__(
+        self,
+        duplicate_iou: float = 0.99,
+        sliver_ratio: float = 0.01,
+        gap_tolerance: float = 0.0
+    ):
+        self.duplicate_iou = duplicate_iou
+        self.sliver_ratio = sliver_ratio
+        self.gap_tolerance = gap_tolerance
+
+    # --------------------------------------------------
+    # PUBLIC API
+    # --------------------------------------------------
+
+    def check(self, collection: FigureCollection) -> TopologyReport:
+        polygons = collection.to_shapely()
+
+        usable = np.flatnonzero(
+            ~shapely.is_missing(polygons) & shapely.is_valid(polygons)
+        )
+        geoms = polygons[usable]
+        tree = STRtree(geoms)
+
+        # Intersecting pairs
+        i, j = self._pairs(tree, geoms, "intersects")
+
+        inter = shapely.area(shapely.intersection(geoms[i], geoms[j]))
+        area_i = shapely.area(geoms[i])
+        area_j = shapely.area(geoms[j])
+        union = area_i + area_j - inter
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            iou = np.where(union > 0, inter / union, 0.0)
+            share = inter / np.minimum(area_i, area_j)
+
+        shared = inter > 0
+        # Codes index PAIR_KINDS
+        kind = np.where(
+            iou >= self.duplicate_iou, 0,
+            np.where(share < self.sliver_ratio, 2, 1)
+        )
+
+        first, second = [i[shared]], [j[shared]]
+        kinds, areas = [kind[shared]], [inter[shared]]
+        ious, dists = [iou[shared]], [np.zeros(shared.sum())]
+
+        # Near but disjoint pairs
+        if self.gap_tolerance > 0:
+            gi, gj = self._pairs(
+                tree, geoms, "dwithin", distance=self.gap_tolerance
+            )
+            dist = shapely.distance(geoms[gi], geoms[gj])
+            gap = dist > 0
+
+            first.append(gi[gap])
+            second.append(gj[gap])
+            kinds.append(np.full(gap.sum(), 3))
+            areas.append(np.zeros(gap.sum()))
+            ious.append(np.zeros(gap.sum()))
+            dists.append(dist[gap])
+
+        first = usable[np.concatenate(first)]
+        second = usable[np.concatenate(second)]
+        kinds = np.concatenate(kinds)
+
+        order = np.lexsort((second, first, kinds))
+
+        return TopologyReport(
+            names=collection.names,
+            sources=collection.sources,
+            first=first[order],
+            second=second[order],
+            kind=np.asarray(PAIR_KINDS, dtype=object)[kinds[order]],
+            overlap_area=np.concatenate(areas)[order],
+            iou=np.concatenate(ious)[order],
+            distance=np.concatenate(dists)[order],
+            skipped=len(collection) - len(usable),
+        )
+
+    # --------------------------------------------------
+    # INTERNAL HELPERS
+    # --------------------------------------------------
+
+    @staticmethod
+    def _pairs(tree: STRtree, geoms: np.ndarray, predicate: str, **kwargs):
+        """
+        Unique unordered pairs (i < j) of tree items satisfying
+        ``predicate``.
+        """
+        i, j = tree.query(geoms, predicate=predicate, **kwargs)
+        keep = i < j
+        return i[keep], j[keep]
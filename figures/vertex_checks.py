@@ -0,0 +1,279 @@
+# Copyright (c) 2026 Jordan Zavaleta
+# This file is part of PyTAB2GIS.
+# PyTAB2GIS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from dataclasses import dataclass
+from typing import Dict, Iterator, Tuple
+
+import numpy as np
+import pandas as pd
+import shapely
+from shapely import STRtree
+
+from pytab2gis.figures.figure_collection import FigureCollection
+from pytab2gis.geometry.polygon_builder import _dense
+
+
+# Issue kinds, in reporting order
+VERTEX_ISSUES = (
+    "duplicate_vertex",
+    "zero_length_edge",
+    "spike",
+    "self_intersection",
+)
+
+
+@dataclass
+class VertexDiagnostics:
+    """
+    Vertex-level issues found by ``VertexChecker.check``.
+
+    One entry per issue. ``figure`` is the figure position in the
+    checked collection, ``vertex`` the vertex position inside the
+    figure and ``row`` its source row label (None when the
+    collection carries no row index). ``x``/``y`` locate the issue;
+    for self-intersections they are the crossing point and
+    ``other_row`` points at the start of the crossing edge.
+    ``value`` is the edge length (zero-length edges) or the vertex
+    angle in degrees (spikes).
+    """
+    names: np.ndarray
+    figure: np.ndarray
+    vertex: np.ndarray
+    row: np.ndarray
+    other_row: np.ndarray
+    kind: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    value: np.ndarray
+
+    def __len__(self):
+        return len(self.kind)
+
+    def counts(self) -> Dict[str, int]:
+        return {k: int((self.kind == k).sum()) for k in VERTEX_ISSUES}
+
+    def summary(self) -> str:
+        counts = self.counts()
+        return ", ".join(f"{k}: {counts[k]}" for k in VERTEX_ISSUES)
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({
+            "figure": self.names[self.figure],
+            "vertex": self.vertex,
+            "row": self.row,
+            "other_row": self.other_row,
+            "kind": self.kind,
+            "x": self.x,
+            "y": self.y,
+            "value": self.value,
+        })
+
+    def messages(self) -> Iterator[str]:
+        for f, v, row, other, kind, x, y, value in zip(
+            self.figure, self.vertex, self.row, self.other_row,
+            self.kind, self.x, self.y, self.value
+        ):
+            where = f"Figure '{self.names[f]}' vertex {v}" + (
+                f" (row {row})" if row is not None else ""
+            )
+
+            if kind == "duplicate_vertex":
+                yield f"{where}: duplicate of the previous vertex at ({x:g}, {y:g})."
+            elif kind == "zero_length_edge":
+                yield f"{where}: near-zero edge length {value:g} at ({x:g}, {y:g})."
+            elif kind == "spike":
+                yield f"{where}: spike with {value:.2f} degree angle at ({x:g}, {y:g})."
+            else:
+                yield (
+                    f"{where}: edge crosses the edge at "
+                    + (f"row {other}" if other is not None else "another vertex")
+                    + f" at ({x:g}, {y:g})."
+                )
+
+
+class VertexChecker:
+    """
+    Vectorized vertex-level checks over the coordinate arrays of a
+    FigureCollection (no per-vertex Python loops).
+
+    Rings are read without their explicit closing vertex and wrap
+    around. Reported issues:
+
+    - duplicate_vertex  : vertex equal to the previous one
+    - zero_length_edge  : edge shorter than ``edge_tolerance``
+                          (exact duplicates excluded)
+    - spike             : vertex angle below ``spike_angle`` degrees
+    - self_intersection : non-adjacent edges of the same figure
+                          that touch or cross, with the location
+    """
+
+    def __init__(self, edge_tolerance: float = 1e-6, spike_angle: float = 5.0):
+        self.edge_tolerance = edge_tolerance
+        self.spike_angle = spike_angle
+
+    # --------------------------------------------------
+    # PUBLIC API
+    # --------------------------------------------------
+
+    def check(self, collection: FigureCollection) -> VertexDiagnostics:
+        counts = collection.vertex_counts
+        closed = collection.is_closed()
+
+        # Ring vertices: drop the explicit closing vertex
+        keep = np.ones(len(collection.coords), dtype=bool)
+        keep[collection.offsets[1:][closed] - 1] = False
+
+        vertex = np.arange(len(keep)) - np.repeat(collection.offsets[:-1], counts)
+        figure = collection.figure_ids
+
+        if collection.row_index is not None:
+            rows = collection.row_index
+        else:
+            rows = np.full(len(keep), None, dtype=object)
+
+        ring = np.flatnonzero(keep)
+        xy = collection.coords[ring]
+        prev, nxt = _neighbours(figure[ring])
+
+        parts = []
+
+        # Duplicates and short edges (edge from the previous vertex)
+        length = np.hypot(*(xy - xy[prev]).T)
+        dup = length == 0
+        short = ~dup & (length < self.edge_tolerance)
+
+        parts.append((0, ring[dup], xy[dup], np.zeros(dup.sum()), None))
+        parts.append((1, ring[short], xy[short], length[short], None))
+
+        # Angles and crossings on the de-duplicated ring
+        ring, xy = ring[~dup], xy[~dup]
+        prev, nxt = _neighbours(figure[ring])
+
+        a = xy[prev] - xy
+        b = xy[nxt] - xy
+        cross = a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+        dot = (a * b).sum(axis=1)
+        angle = np.degrees(np.arctan2(np.abs(cross), dot))
+
+        spike = (prev != nxt) & (angle < self.spike_angle)
+        parts.append((2, ring[spike], xy[spike], angle[spike], None))
+
+        parts.append(self._crossings(ring, xy, nxt, figure))
+
+        kind = np.concatenate([np.full(len(p[1]), p[0]) for p in parts])
+        where = np.concatenate([p[1] for p in parts])
+        loc = np.concatenate([p[2] for p in parts]).reshape(-1, 2)
+        value = np.concatenate([p[3] for p in parts])
+        other = np.concatenate([
+            rows[p[4]] if p[4] is not None else np.full(len(p[1]), None, dtype=object)
+            for p in parts
+        ])
+
+        order = np.lexsort((where, kind, figure[where]))
+
+        return VertexDiagnostics(
+            names=collection.names,
+            figure=figure[where][order],
+            vertex=vertex[where][order],
+            row=rows[where][order],
+            other_row=other[order],
+            kind=np.asarray(VERTEX_ISSUES, dtype=object)[kind[order]],
+            x=loc[order, 0],
+            y=loc[order, 1],
+            value=value[order],
+        )
+
+    # --------------------------------------------------
+    # INTERNAL HELPERS
+    # --------------------------------------------------
+
+    @staticmethod
+    def _crossings(
+        ring: np.ndarray,
+        xy: np.ndarray,
+        nxt: np.ndarray,
+        figure: np.ndarray
+    ) -> Tuple:
+        """
+        Intersections between non-adjacent edges of the same ring.
+
+        Only rings that are not simple are searched, with an
+        STRtree over their edges.
+        """
+        owner = figure[ring]
+        ids, codes, sizes = np.unique(owner, return_inverse=True, return_counts=True)
+
+        rings = np.full(len(ids), None, dtype=object)
+        big = sizes >= 3
+        if big.any():
+            sel = big[codes]
+            # Skipped short rings leave gaps in the (sorted) codes
+            rings[big] = shapely.linearrings(xy[sel], indices=_dense(codes[sel]))
+
+        # Rings of fewer than three vertices have only adjacent edges
+        search = np.flatnonzero(
+            big & ~shapely.is_simple(rings).astype(bool)
+        )
+        cand = np.flatnonzero(np.isin(codes, search))
+
+        if not len(cand):
+            return 3, ring[:0], np.empty((0, 2)), np.empty(0), ring[:0]
+
+        edges = _segments(xy, nxt, cand)
+        i, j = STRtree(edges).query(edges, predicate="intersects")
+        i, j = cand[i], cand[j]
+
+        keep = (i < j) & (owner[i] == owner[j]) & (nxt[i] != j) & (nxt[j] != i)
+        i, j = i[keep], j[keep]
+
+        # Crossing point, or the middle of a collinear overlap
+        points = shapely.get_coordinates(shapely.centroid(
+            shapely.intersection(_segments(xy, nxt, i), _segments(xy, nxt, j))
+        )).reshape(-1, 2)
+
+        return 3, ring[i], points, np.full(len(i), np.nan), ring[j]
+
+
+def _segments(xy: np.ndarray, nxt: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """
+    Edges starting at ring positions ``k`` as LineStrings.
+    """
+    if not len(k):
+        return np.empty(0, dtype=object)
+
+    return shapely.linestrings(np.stack((xy[k], xy[nxt[k]]), axis=1))
+
+
+def _neighbours(owner: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Previous/next positions around each ring, for items grouped
+    contiguously by ``owner``.
+    """
+    n = len(owner)
+    idx = np.arange(n)
+
+    if n == 0:
+        return idx, idx
+
+    start = np.r_[True, owner[1:] != owner[:-1]]
+    end = np.r_[start[1:], True]
+
+    first = np.maximum.accumulate(np.where(start, idx, 0))
+    last = np.flip(np.minimum.accumulate(np.flip(np.where(end, idx, n))))
+
+    prev = np.where(start, last, idx - 1)
+    nxt = np.where(end, first, idx + 1)
+
+    return prev, nxt
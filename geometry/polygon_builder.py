@@ -13,6 +13,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import numpy as np
+import shapely
 from shapely.geometry import Polygon
 import pandas as pd
 from typing import Optional
@@ -43,3 +45,82 @@ def build_polygon(
         return None
 
     return polygon
+
+
+def build_geometries_from_offsets(
+    coords: np.ndarray,
+    offsets: np.ndarray,
+    repair: bool = True
+) -> np.ndarray:
+    """
+    Vectorized construction of one geometry per vertex group.
+
+    Parameters
+    ----------
+    coords : (N, 2) float array
+        Vertices of all groups, concatenated in drawing order.
+    offsets : (G + 1,) int array
+        Group ``i`` spans ``coords[offsets[i]:offsets[i + 1]]``.
+    repair : bool
+        Repair invalid polygons with ``buffer(0)`` (only the
+        invalid subset is touched).
+
+    Returns
+    -------
+    numpy object array of length G
+        Polygon (>= 3 vertices, rings closed automatically),
+        LineString (2 vertices) or None when no valid geometry
+        can be built.
+    """
+    coords = np.asarray(coords, dtype="float64")
+    offsets = np.asarray(offsets, dtype="int64")
+    counts = np.diff(offsets)
+
+    geoms = np.full(len(counts), None, dtype=object)
+    group_ids = np.repeat(np.arange(len(counts)), counts)
+
+    # -------- Polygons: one call over all rings --------
+    is_poly = counts >= 3
+    if is_poly.any():
+        take = is_poly[group_ids]
+        rings = shapely.linearrings(
+            coords[take],
+            indices=_dense(group_ids[take])
+        )
+        geoms[is_poly] = shapely.polygons(rings)
+
+    # -------- Lines --------
+    is_line = counts == 2
+    if is_line.any():
+        take = is_line[group_ids]
+        geoms[is_line] = shapely.linestrings(
+            coords[take],
+            indices=_dense(group_ids[take])
+        )
+
+    built = is_poly | is_line
+    valid = np.zeros(len(counts), dtype=bool)
+    valid[built] = shapely.is_valid(geoms[built])
+
+    # -------- Repair only the invalid polygons --------
+    broken = is_poly & ~valid
+    if repair and broken.any():
+        geoms[broken] = shapely.buffer(geoms[broken], 0)
+        valid[broken] = shapely.is_valid(geoms[broken])
+
+    keep = built & valid
+    keep[keep] = ~shapely.is_empty(geoms[keep])
+
+    geoms[~keep] = None
+    return geoms
+
+
+def _dense(ids: np.ndarray) -> np.ndarray:
+    """
+    Renumbers sorted group ids to 0..k-1 (shapely requires
+    contiguous output indices).
+    """
+    if len(ids) == 0:
+        return ids
+
+    return np.concatenate(([0], np.cumsum(ids[1:] != ids[:-1])))
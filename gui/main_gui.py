@@ -13,16 +13,28 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import multiprocessing
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import webbrowser
 
-from pytab2gis.io.excel_reader import ExcelReader
-from pytab2gis.core.pipeline import build_geometries_from_table_pipeline
+import numpy as np
+import pandas as pd
+
+from pytab2gis.io.table_readers import open_reader
+from pytab2gis.io.sheet_cache import SheetCache
+from pytab2gis.core.pipeline import build_geometries_from_file
 from pytab2gis.config.table_config import TableConfig
+from pytab2gis.crs.reprojection import reproject_geometries
+from pytab2gis.crs.crs_suggest import suggest_crs_for
 from pytab2gis.export.exporter import export_geometries
 
 
+# Below this many sheets, worker start-up costs more than it saves
+PARALLEL_MIN_SHEETS = 4
+
+
 class PyTAB2GIS_GUI:
     def __init__(self, root):
         self.root = root
@@ -38,12 +50,14 @@ class PyTAB2GIS_GUI:
         self.root.columnconfigure(2, weight=0)
 
         self.columns = []
+        # Created on first use when "cache parsed sheets" is checked
+        self._sheet_cache = None
         row = 0
 
         # -------------------------
         # INPUT FILE
         # -------------------------
-        tk.Label(root, text="Input Excel (.xlsx)").grid(
+        tk.Label(root, text="Input table (.xlsx, .csv, .parquet)").grid(
             row=row, column=0, sticky="w", padx=6, pady=3
         )
         self.input_entry = tk.Entry(root)
@@ -76,13 +90,20 @@ class PyTAB2GIS_GUI:
         self._combo("Vertex column", row, "VERTICE")
 
         row += 1
-        self._combo(
+        component_frame = self._combo(
             "Component column (defines figures, optional)",
             row,
             "COMPONENTE",
             help_button=True
         )
 
+        self.split_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            component_frame,
+            text="else split on vertex reset",
+            variable=self.split_var
+        ).pack(side="left", padx=(6, 0))
+
         # -------------------------
         # CRS
         # -------------------------
@@ -99,6 +120,13 @@ class PyTAB2GIS_GUI:
         self.epsg_entry.insert(0, "32718")
         self.epsg_entry.pack(side="left")
 
+        self.suggest_button = tk.Button(
+            crs_frame,
+            text="Suggest",
+            command=self.suggest_crs
+        )
+        self.suggest_button.pack(side="left", padx=(4, 0))
+
         tk.Button(
             crs_frame,
             text="ⓘ",
@@ -106,6 +134,15 @@ class PyTAB2GIS_GUI:
             command=self.show_crs_help
         ).pack(side="left", padx=(4, 0))
 
+        # Optional output CRS (reprojected on export)
+        tk.Label(crs_frame, text="→ output").pack(side="left", padx=(10, 0))
+        self.target_epsg_entry = tk.Entry(crs_frame, width=8)
+        self.target_epsg_entry.pack(side="left", padx=(4, 0))
+
+        tk.Label(crs_frame, text="densify").pack(side="left", padx=(6, 0))
+        self.densify_entry = tk.Entry(crs_frame, width=6)
+        self.densify_entry.pack(side="left", padx=(4, 0))
+
         # -------------------------
         # EXPORT OPTIONS
         # -------------------------
@@ -114,8 +151,11 @@ class PyTAB2GIS_GUI:
             row=row, column=0, sticky="w", padx=6, pady=3
         )
 
+        export_frame = tk.Frame(root)
+        export_frame.grid(row=row, column=1, sticky="w", padx=6, pady=3)
+
         self.export_combo = ttk.Combobox(
-            root,
+            export_frame,
             width=28,
             state="readonly",
             values=[
@@ -126,7 +166,15 @@ class PyTAB2GIS_GUI:
             ]
         )
         self.export_combo.current(1)
-        self.export_combo.grid(row=row, column=1, sticky="w", padx=6, pady=3)
+        self.export_combo.pack(side="left")
+
+        # Opt-in: parsed sheets are written under ~/.cache/pytab2gis
+        self.cache_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            export_frame,
+            text="cache parsed sheets",
+            variable=self.cache_var
+        ).pack(side="left", padx=(6, 0))
 
         # -------------------------
         # RUN
@@ -193,6 +241,18 @@ class PyTAB2GIS_GUI:
     # UI HELPERS
     # --------------------------------------------------
 
+    def sheet_cache(self):
+        """
+        On-disk sheet cache when the user opted in, else None.
+        """
+        if not self.cache_var.get():
+            return None
+
+        if self._sheet_cache is None:
+            self._sheet_cache = SheetCache()
+
+        return self._sheet_cache
+
     def _combo(self, label, row, default, help_button=False):
         tk.Label(self.root, text=label).grid(
             row=row, column=0, sticky="w", padx=6, pady=3
@@ -216,6 +276,8 @@ class PyTAB2GIS_GUI:
                 command=self.show_component_help
             ).pack(side="left", padx=(4, 0))
 
+        return frame
+
     # --------------------------------------------------
     # HELP
     # --------------------------------------------------
@@ -224,15 +286,118 @@ class PyTAB2GIS_GUI:
         messagebox.showinfo(
             "Coordinate Reference System (CRS)",
             "Enter the EPSG code corresponding to the coordinate system of your data.\n\n"
-            "Example: EPSG:32718 (UTM Zone 18S)"
+            "Example: EPSG:32718 (UTM Zone 18S)\n\n"
+            "Optionally enter an output EPSG code to reproject the results "
+            "(e.g. 4326), and a densify length (input CRS units) to add "
+            "vertices along long edges before reprojecting."
         )
 
     def show_component_help(self):
         messagebox.showinfo(
             "Component column",
             "Defines how vertices are grouped into individual features.\n\n"
-            "If left empty, all vertices are treated as a single feature."
+            "If left empty, all vertices are treated as a single feature, "
+            "unless 'split on vertex reset' is checked: then a new feature "
+            "starts whenever the vertex number does not increase."
+        )
+
+    # --------------------------------------------------
+    # CRS SUGGESTION
+    # --------------------------------------------------
+
+    def suggest_crs(self):
+        """
+        Proposes EPSG codes whose area of use contains the loaded
+        coordinates (X/Y columns of every sheet).
+
+        Reading the sheets and the first build of the CRS index take
+        seconds, so they run in a worker thread while the button
+        shows a busy state.
+        """
+        input_file = self.input_entry.get()
+        x_col, y_col = self.x_combo.get(), self.y_combo.get()
+
+        if not input_file or not x_col or not y_col:
+            messagebox.showerror(
+                "Error", "Select the input table and its X/Y columns first."
+            )
+            return
+
+        cache = self.sheet_cache()
+        result = {}
+
+        def work():
+            try:
+                sheets = open_reader(input_file, cache=cache).read(
+                    columns=[x_col, y_col]
+                )
+
+                coords = np.concatenate([
+                    np.column_stack((
+                        pd.to_numeric(df[x_col], errors="coerce"),
+                        pd.to_numeric(df[y_col], errors="coerce")
+                    ))
+                    for df in sheets.values()
+                ])
+
+                result["suggestions"] = suggest_crs_for(coords)
+            except Exception as e:
+                result["error"] = e
+
+        self.suggest_button.config(state="disabled", text="Suggesting…")
+        self.root.config(cursor="watch")
+
+        worker = threading.Thread(target=work, daemon=True)
+        worker.start()
+        self._wait_suggestions(worker, result)
+
+    def _wait_suggestions(self, worker, result):
+        # Tk is not thread-safe: poll from the event loop
+        if worker.is_alive():
+            self.root.after(100, self._wait_suggestions, worker, result)
+            return
+
+        self.suggest_button.config(state="normal", text="Suggest")
+        self.root.config(cursor="")
+
+        if "error" in result:
+            messagebox.showerror("Error", str(result["error"]))
+            return
+
+        self._show_suggestions(result["suggestions"])
+
+    def _show_suggestions(self, suggestions):
+        if not suggestions:
+            messagebox.showinfo(
+                "Suggested CRS",
+                "No known CRS area of use contains these coordinates."
+            )
+            return
+
+        candidates = "\n".join(
+            f"EPSG:{s.epsg} — {s.name}" for s in suggestions
         )
+        best = [s.epsg for s in suggestions if s.rank == suggestions[0].rank]
+
+        # Several UTM zones of one datum: the coordinates cannot tell
+        # them apart, so do not pick one
+        if len(best) > 1:
+            messagebox.showinfo(
+                "Suggested CRS",
+                f"Candidates for the loaded coordinates:\n\n{candidates}\n\n"
+                f"{', '.join(f'EPSG:{e}' for e in best)} fit equally well: "
+                "projected coordinates do not identify the UTM zone. "
+                "Enter the zone the survey was made in."
+            )
+            return
+
+        if messagebox.askyesno(
+            "Suggested CRS",
+            f"Candidates for the loaded coordinates:\n\n{candidates}\n\n"
+            f"Use EPSG:{best[0]}?"
+        ):
+            self.epsg_entry.delete(0, tk.END)
+            self.epsg_entry.insert(0, str(best[0]))
 
     # --------------------------------------------------
     # FILE DIALOGS
@@ -240,7 +405,12 @@ class PyTAB2GIS_GUI:
 
     def browse_input(self):
         path = filedialog.askopenfilename(
-            filetypes=[("Excel files", "*.xlsx")]
+            filetypes=[
+                ("Tables", "*.xlsx *.csv *.parquet *.feather"),
+                ("Excel files", "*.xlsx"),
+                ("CSV files", "*.csv"),
+                ("Parquet / Feather", "*.parquet *.feather"),
+            ]
         )
         if not path:
             return
@@ -248,10 +418,10 @@ class PyTAB2GIS_GUI:
         self.input_entry.delete(0, tk.END)
         self.input_entry.insert(0, path)
 
-        reader = ExcelReader(path)
-        sheets = reader.read()
-        first_df = next(iter(sheets.values()))
-        self.columns = list(first_df.columns)
+        # Header probe only: sheet bodies are parsed on Run
+        previews = open_reader(path).probe(n_rows=0)
+        first = next(iter(previews.values()))
+        self.columns = list(first.columns)
 
         for attr in ["x", "y", "vertex", "component"]:
             cb = getattr(self, f"{attr}_combo")
@@ -281,20 +451,37 @@ class PyTAB2GIS_GUI:
                 x_column=self.x_combo.get(),
                 y_column=self.y_combo.get(),
                 vertex_column=self.vertex_combo.get(),
-                component_column=self.component_combo.get() or None
+                component_column=self.component_combo.get() or None,
+                split_on_vertex_reset=self.split_var.get()
             )
 
-            reader = ExcelReader(input_file)
-            sheets = reader.read()
+            n_sheets = len(open_reader(input_file).read_headers())
 
-            geometries = []
-            for _, df in sheets.items():
-                geoms = build_geometries_from_table_pipeline(df, config)
-                geometries.extend(geoms)
+            duplicates = []
+            geometries = build_geometries_from_file(
+                input_file,
+                config,
+                jobs=0 if n_sheets >= PARALLEL_MIN_SHEETS else 1,
+                cache=self.sheet_cache(),
+                reports=duplicates
+            )
 
             if not geometries:
                 raise RuntimeError("No valid geometries were generated.")
 
+            epsg = int(self.epsg_entry.get())
+            target = self.target_epsg_entry.get().strip()
+            densify = self.densify_entry.get().strip()
+
+            if target:
+                geometries = reproject_geometries(
+                    geometries,
+                    epsg,
+                    int(target),
+                    densify=float(densify) if densify else None
+                )
+                epsg = int(target)
+
             selection = self.export_combo.get()
 
             if selection == "GeoPackage (GPKG)":
@@ -319,16 +506,21 @@ class PyTAB2GIS_GUI:
             export_geometries(
                 geometries=geometries,
                 output_dir=output_dir,
-                epsg=int(self.epsg_entry.get()),
+                epsg=epsg,
                 export_format=export_format,
                 export_dxf=export_dxf,
                 zip_output=zip_output
             )
 
+            summary = "".join(
+                f"\nDuplicates: {report.summary()}"
+                for report in duplicates if len(report)
+            )
+
             messagebox.showinfo(
                 "Done",
                 f"Export completed successfully.\n"
-                f"Objects exported: {len(geometries)}"
+                f"Objects exported: {len(geometries)}{summary}"
             )
 
         except Exception as e:
@@ -336,6 +528,9 @@ class PyTAB2GIS_GUI:
 
 
 if __name__ == "__main__":
+    # Required for the sheet worker pool in frozen executables
+    multiprocessing.freeze_support()
+
     root = tk.Tk()
     PyTAB2GIS_GUI(root)
     root.mainloop()
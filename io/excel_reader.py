@@ -14,9 +14,27 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import numpy as np
 import pandas as pd
-from shapely.geometry import Polygon, LineString
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pytab2gis.geometry.polygon_builder import build_geometries_from_offsets
+from pytab2gis.table.normalizer import vertex_sort_keys
+from pytab2gis.table.figure_detector import detect_figure_ranges
+
+
+@dataclass
+class SheetPreview:
+    """
+    Header row and first rows of a sheet, as returned by
+    ``ExcelReader.probe``.
+    """
+    name: str
+    columns: List[str]
+    sample: pd.DataFrame
 
 
 class ExcelReader:
@@ -26,14 +44,72 @@ class ExcelReader:
     to each DataFrame for downstream naming.
     """
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, cache=None):
+        """
+        Parameters
+        ----------
+        path : str
+            Input workbook.
+        cache : SheetCache, optional
+            On-disk cache of parsed sheets; repeat reads of an
+            unchanged file skip XLSX decoding.
+        """
         self.path = path
+        self.cache = cache
+        self._wb = None
+
+    @contextmanager
+    def session(self):
+        """
+        Keeps the workbook open for the reads made inside the
+        block, so several sheets are read with one workbook load
+        (shared strings and styles are parsed once).
+        """
+        if self._wb is not None:
+            yield self
+            return
+
+        with _open_workbook(self.path) as wb:
+            self._wb = wb
+            try:
+                yield self
+            finally:
+                self._wb = None
+
+    def read(
+        self,
+        sheet_name: Optional[str] = None,
+        columns: Optional[List[str]] = None
+    ) -> dict:
+        """
+        Parameters
+        ----------
+        sheet_name : str, optional
+            Single sheet to read (default: all sheets).
+        columns : list of str, optional
+            Column projection. Headers are resolved first and only
+            the matching columns are parsed; names missing from a
+            sheet are ignored (downstream validation reports them).
+        """
+        sheets = None
+
+        if self.cache is not None:
+            sheets = self.cache.get(self.path, sheet_name, columns)
+
+        if sheets is None:
+            if columns is None:
+                sheets = pd.read_excel(self.path, sheet_name=sheet_name)
 
-    def read(self) -> dict:
-        sheets = pd.read_excel(self.path, sheet_name=None)
+                # A single sheet comes back as a bare DataFrame
+                if sheet_name is not None:
+                    sheets = {sheet_name: sheets}
+            else:
+                sheets = self._read_projected(sheet_name, columns)
 
-        # Base name of the input file (without extension)
-        base_name = os.path.splitext(os.path.basename(self.path))[0]
+            if self.cache is not None:
+                self.cache.put(self.path, sheets, sheet_name, columns)
+
+        base_name = self.table_name()
 
         for sheet_name, df in sheets.items():
             # Attach source name for geometry naming
@@ -41,6 +117,222 @@ class ExcelReader:
 
         return sheets
 
+    def read_headers(self, sheet_name: Optional[str] = None) -> Dict[str, List[str]]:
+        """
+        Returns the header row of each sheet without decoding
+        sheet bodies.
+        """
+        return {
+            name: preview.columns
+            for name, preview in self.probe(sheet_name, n_rows=0).items()
+        }
+
+    def probe(
+        self,
+        sheet_name: Optional[str] = None,
+        n_rows: int = 5
+    ) -> Dict[str, SheetPreview]:
+        """
+        Fast preview of a workbook: sheet names, header rows and
+        the first ``n_rows`` rows of each sheet. Sheet bodies past
+        the sample are never decoded.
+        """
+        previews: Dict[str, SheetPreview] = {}
+
+        with self._workbook() as wb:
+            for name in _sheet_names(wb, sheet_name):
+                rows = wb[name].iter_rows(
+                    max_row=n_rows + 1, values_only=True
+                )
+                columns = _header_names(next(rows, ()))
+                positions = list(range(len(columns)))
+
+                previews[name] = SheetPreview(
+                    name=name,
+                    columns=columns,
+                    sample=pd.DataFrame(
+                        [_take(row, positions) for row in rows],
+                        columns=columns
+                    )
+                )
+
+        return previews
+
+    @contextmanager
+    def _workbook(self):
+        # Session workbook if open, else one for this read only
+        if self._wb is not None:
+            yield self._wb
+            return
+
+        with _open_workbook(self.path) as wb:
+            yield wb
+
+    def table_name(self) -> str:
+        """
+        Base name of the input file (without extension).
+        """
+        return os.path.splitext(os.path.basename(self.path))[0]
+
+    def _read_projected(
+        self,
+        sheet_name: Optional[str],
+        columns: List[str]
+    ) -> dict:
+        """
+        Builds each sheet from the projected cells only: rows are
+        read in read-only mode up to the last projected column, so
+        cells to the right are never decoded (``usecols`` would
+        still parse every cell and drop columns afterwards).
+        """
+        sheets = {}
+
+        with self._workbook() as wb:
+            for name in _sheet_names(wb, sheet_name):
+                ws = wb[name]
+                header = _header_names(
+                    next(ws.iter_rows(max_row=1, values_only=True), ())
+                )
+                positions = _project(header, columns)
+
+                if not positions:
+                    sheets[name] = pd.DataFrame()
+                    continue
+
+                rows = [
+                    _take(row, positions)
+                    for row in ws.iter_rows(
+                        min_row=2,
+                        max_col=max(positions) + 1,
+                        values_only=True
+                    )
+                ]
+
+                # Like pandas, ignore trailing empty rows
+                while rows and all(v is None for v in rows[-1]):
+                    rows.pop()
+
+                sheets[name] = pd.DataFrame(
+                    rows,
+                    columns=[header[i] for i in positions]
+                )
+
+        return sheets
+
+    # --------------------------------------------------
+    # STREAMING
+    # --------------------------------------------------
+
+    def iter_sheet_rows(
+        self,
+        sheet_name: Optional[str] = None,
+        columns: Optional[List[str]] = None
+    ) -> Iterator[Tuple[str, List[str], Iterator[tuple]]]:
+        """
+        Streams sheets row by row without building DataFrames.
+
+        The workbook is opened in read-only mode, so only the row
+        being decoded is held in memory. With ``columns``, cells
+        past the last projected column are never decoded and rows
+        only carry the projected values.
+
+        Yields
+        ------
+        (sheet_name, columns, rows)
+            ``rows`` is a lazy iterator of value tuples aligned with
+            ``columns``. It must be consumed before advancing to the
+            next sheet.
+        """
+        with self._workbook() as wb:
+            for name in _sheet_names(wb, sheet_name):
+                ws = wb[name]
+                header = next(
+                    ws.iter_rows(max_row=1, values_only=True), None
+                )
+
+                if header is None:
+                    continue
+
+                names = _header_names(header)
+                positions = (
+                    _project(names, columns)
+                    if columns is not None
+                    else list(range(len(names)))
+                )
+
+                rows = ws.iter_rows(
+                    min_row=2,
+                    max_col=max(positions, default=0) + 1,
+                    values_only=True
+                )
+
+                yield name, [names[i] for i in positions], (
+                    _take(row, positions) for row in rows
+                )
+
+
+@contextmanager
+def _open_workbook(path: str):
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield wb
+    finally:
+        wb.close()
+
+
+def _sheet_names(wb, sheet_name: Optional[str]) -> List[str]:
+    if sheet_name is None:
+        return list(wb.sheetnames)
+
+    if sheet_name not in wb.sheetnames:
+        raise ValueError(f"Worksheet not found: {sheet_name}")
+
+    return [sheet_name]
+
+
+def _project(header: List[str], columns: List[str]) -> List[int]:
+    """
+    Positions of the requested columns in a header row.
+    """
+    wanted = set(columns)
+    return [i for i, name in enumerate(header) if name in wanted]
+
+
+def _take(row: tuple, positions: List[int]) -> tuple:
+    # Read-only rows may be shorter than the header
+    width = len(row)
+    return tuple(row[i] if i < width else None for i in positions)
+
+
+def _header_names(header: tuple) -> List[str]:
+    """
+    Builds column labels from a raw header row, following the
+    pandas conventions for unnamed and duplicated headers.
+    """
+    # Trailing empty header cells carry no columns
+    cells = list(header)
+    while cells and cells[-1] is None:
+        cells.pop()
+
+    columns: List[str] = []
+    seen = {}
+
+    for i, cell in enumerate(cells):
+        name = f"Unnamed: {i}" if cell is None else cell
+
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+
+        columns.append(name)
+
+    return columns
+
+
 def build_geometries_from_table(
     df: pd.DataFrame,
     config
@@ -63,71 +355,90 @@ def build_geometries_from_table(
             f"Selected component column not found: {component_col}"
         )
 
-    # Preserve source table name (lost on DataFrame copy)
     table_name = getattr(df, "_table_name", None)
 
-    df = df.copy()
-
-    if table_name:
-        df._table_name = table_name
-
-    # Drop rows without coordinates
-    df = df.dropna(subset=[x_col, y_col])
-
-    # Ensure vertex sortable
-    df[vertex_col] = df[vertex_col].astype(str).str.strip()
-
-    def _vertex_key(v):
-        try:
-            return int(v)
-        except Exception:
-            return v
-
-    geometries: List[Tuple[str, object]] = []
-
     # -------------------------
     # GROUPING LOGIC
     # -------------------------
 
     if component_col is not None:
-        df[component_col] = df[component_col].ffill()
-        groups = df.groupby(component_col)
+        names = df[component_col].ffill()
+    elif getattr(config, "split_on_vertex_reset", False):
+        names = _vertex_reset_names(df, vertex_col, table_name)
     else:
         if not table_name:
             raise RuntimeError(
                 "Internal error: input table name not available."
             )
-        groups = [(table_name, df)]
+        names = pd.Series(table_name, index=df.index)
 
-    # -------------------------
-    # BUILD GEOMETRIES
-    # -------------------------
-    for name, g in groups:
-        if g.empty:
-            continue
+    # Drop rows without coordinates or outside any component
+    xs = pd.to_numeric(df[x_col], errors="coerce").to_numpy("float64")
+    ys = pd.to_numeric(df[y_col], errors="coerce").to_numpy("float64")
+    keep = np.isfinite(xs) & np.isfinite(ys) & names.notna().to_numpy()
 
-        g = g.copy()
-        g["_vkey"] = g[vertex_col].apply(_vertex_key)
-        g = g.sort_values("_vkey")
+    names = names[keep]
+    codes, uniques = _factorize(names)
 
-        coords = list(zip(g[x_col], g[y_col]))
+    # Natural-order vertex keys as native integers
+    vkeys = vertex_sort_keys(df.loc[keep, vertex_col])
 
-        if len(coords) < 2:
-            continue
+    # -------------------------
+    # ONE SORT: (component, vertex)
+    # -------------------------
+    order = np.lexsort((vkeys, codes))
 
-        if len(coords) >= 3:
-            geom = Polygon(coords)
-            if not geom.is_valid:
-                geom = geom.buffer(0)
-        else:
-            geom = LineString(coords)
+    codes = codes[order]
+    coords = np.column_stack((xs[keep], ys[keep]))[order]
 
-        if geom.is_empty or not geom.is_valid:
-            continue
+    # Group boundaries in the sorted vertex array
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) \
+        if len(codes) else np.empty(0, dtype="int64")
+    offsets = np.r_[starts, len(codes)]
 
-        geometries.append((str(name), geom))
+    # -------------------------
+    # BUILD GEOMETRIES (vectorized)
+    # -------------------------
+    geoms = build_geometries_from_offsets(coords, offsets)
+
+    geometries: List[Tuple[str, object]] = [
+        (str(uniques[code]), geom)
+        for code, geom in zip(codes[starts], geoms)
+        if geom is not None
+    ]
 
     if not geometries:
         raise RuntimeError("No valid geometries were generated.")
 
     return geometries
+
+
+def _vertex_reset_names(
+    df: pd.DataFrame,
+    vertex_col: str,
+    table_name: Optional[str]
+) -> pd.Series:
+    """
+    Figure name per row from vertex resets (NaN for empty rows).
+    """
+    rows, ranges = detect_figure_ranges(df, vertex_col)
+    prefix = f"{table_name}_" if table_name else ""
+
+    labels = np.full(len(df), None, dtype=object)
+    labels[rows] = np.repeat(
+        [f"{prefix}{r.name}" for r in ranges],
+        [r.stop - r.start for r in ranges]
+    )
+
+    return pd.Series(labels, index=df.index)
+
+
+def _factorize(names: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Integer codes of component names, ordered like ``groupby``.
+    """
+    try:
+        return pd.factorize(names, sort=True)
+    except TypeError:
+        # Mixed name types cannot be ordered: keep first appearance
+        return pd.factorize(names, sort=False)
@@ -0,0 +1,224 @@
+# Copyright (c) 2026 Jordan Zavaleta
+# This file is part of PyTAB2GIS.
+# PyTAB2GIS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from importlib.util import find_spec
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "PYTAB2GIS_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "pytab2gis")
+)
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+_INDEX = "index.json"
+
+
+class SheetCache:
+    """
+    On-disk cache of parsed sheets.
+
+    Each parsed workbook is stored as one Parquet file per sheet,
+    keyed by path, mtime, size and content hash of the source file
+    plus the read options. Reads that Parquet cannot represent
+    (mixed-type columns, no pyarrow) are not cached, so nothing
+    executable is ever loaded back from disk. Entries are evicted
+    in least-recently-used order once ``max_bytes`` is exceeded.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self._hashes: Dict[tuple, str] = {}
+
+    # --------------------------------------------------
+    # PUBLIC API
+    # --------------------------------------------------
+
+    def key(
+        self,
+        path: str,
+        sheet_name: Optional[str] = None,
+        columns: Optional[List[str]] = None
+    ) -> str:
+        """
+        Cache key of a read: source identity, content hash and
+        read options.
+        """
+        path = os.path.realpath(path)
+        stat = os.stat(path)
+        identity = (path, stat.st_mtime_ns, stat.st_size)
+
+        # Hashing is cheap next to XLSX decoding, but only do it
+        # once per file version and process
+        if identity not in self._hashes:
+            self._hashes[identity] = _file_digest(path)
+
+        payload = json.dumps(
+            [*identity, self._hashes[identity], sheet_name, columns],
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        path: str,
+        sheet_name: Optional[str] = None,
+        columns: Optional[List[str]] = None
+    ) -> Optional[dict]:
+        """
+        Returns the cached ``{sheet_name: DataFrame}`` or None.
+        """
+        entry = os.path.join(self.cache_dir, self.key(path, sheet_name, columns))
+        index_path = os.path.join(entry, _INDEX)
+
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                index = json.load(f)
+
+            sheets = {
+                item["sheet"]: _load(os.path.join(entry, item["file"]))
+                for item in index["sheets"]
+            }
+        except Exception:
+            # Missing or unreadable entry: plain cache miss
+            return None
+
+        # Mark as recently used
+        try:
+            os.utime(index_path)
+        except OSError:
+            pass
+
+        return sheets
+
+    def put(
+        self,
+        path: str,
+        sheets: dict,
+        sheet_name: Optional[str] = None,
+        columns: Optional[List[str]] = None
+    ) -> None:
+        """
+        Stores parsed sheets. Failures never break a read: the
+        cache is silently skipped.
+        """
+        if find_spec("pyarrow") is None:
+            return
+
+        entry = os.path.join(self.cache_dir, self.key(path, sheet_name, columns))
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            work_dir = tempfile.mkdtemp(prefix=".tmp_", dir=self.cache_dir)
+        except OSError:
+            return
+
+        try:
+            items = []
+            for i, (name, df) in enumerate(sheets.items()):
+                items.append(
+                    {"sheet": name, "file": _dump(df, work_dir, f"{i:04d}")}
+                )
+
+            with open(os.path.join(work_dir, _INDEX), "w", encoding="utf-8") as f:
+                json.dump({"source": path, "sheets": items}, f)
+
+            # Atomic publish; a concurrent writer may have won
+            if os.path.isdir(entry):
+                shutil.rmtree(work_dir, ignore_errors=True)
+            else:
+                os.replace(work_dir, entry)
+        except (OSError, ValueError, TypeError):
+            # Parquet rejects mixed-type object columns and
+            # non-string headers: leave that read uncached
+            shutil.rmtree(work_dir, ignore_errors=True)
+            return
+
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Removes least-recently-used entries until the cache fits
+        in ``max_bytes``.
+        """
+        entries = []
+        total = 0
+
+        for name in os.listdir(self.cache_dir):
+            entry = os.path.join(self.cache_dir, name)
+            index_path = os.path.join(entry, _INDEX)
+
+            if not os.path.isfile(index_path):
+                continue
+
+            size = sum(
+                os.path.getsize(os.path.join(entry, f))
+                for f in os.listdir(entry)
+            )
+            entries.append((os.path.getmtime(index_path), size, entry))
+            total += size
+
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+    def clear(self) -> None:
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+# --------------------------------------------------
+# Utils
+# --------------------------------------------------
+
+def _file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def _dump(df: pd.DataFrame, folder: str, stem: str) -> str:
+    """
+    Writes one sheet as Parquet. Returns the file name.
+    """
+    name = f"{stem}.parquet"
+    df.to_parquet(os.path.join(folder, name))
+    return name
+
+
+def _load(path: str) -> pd.DataFrame:
+    if not path.endswith(".parquet"):
+        raise ValueError(f"Not a Parquet cache file: {path}")
+
+    return pd.read_parquet(path)
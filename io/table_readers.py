@@ -0,0 +1,326 @@
+# Copyright (c) 2026 Jordan Zavaleta
+# This file is part of PyTAB2GIS.
+# PyTAB2GIS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import csv
+import os
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from pytab2gis.io.excel_reader import ExcelReader, SheetPreview
+
+
+# Input extensions understood by open_reader
+EXCEL_EXTENSIONS = (".xlsx", ".xlsm")
+CSV_EXTENSIONS = (".csv", ".txt")
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+FEATHER_EXTENSIONS = (".feather", ".arrow")
+
+SUPPORTED_EXTENSIONS = (
+    EXCEL_EXTENSIONS
+    + CSV_EXTENSIONS
+    + PARQUET_EXTENSIONS
+    + FEATHER_EXTENSIONS
+)
+
+# Extensions picked up when expanding folders and globs. ".txt"
+# and ".arrow" are too generic (notes, IPC streams) and are only
+# read when passed explicitly.
+DISCOVERED_EXTENSIONS = (
+    EXCEL_EXTENSIONS
+    + (".csv",)
+    + PARQUET_EXTENSIONS
+    + (".feather",)
+)
+
+
+def open_reader(path: str, cache=None):
+    """
+    Returns the reader matching the input file extension.
+
+    All readers share the ExcelReader contract: ``read`` returns
+    ``{sheet_name: DataFrame}`` with ``_table_name`` attached.
+    Single-table formats expose one sheet named after the file.
+    """
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext in EXCEL_EXTENSIONS:
+        return ExcelReader(path, cache=cache)
+
+    if ext in CSV_EXTENSIONS:
+        return CSVReader(path, cache=cache)
+
+    if ext in PARQUET_EXTENSIONS:
+        return ParquetReader(path)
+
+    if ext in FEATHER_EXTENSIONS:
+        return FeatherReader(path)
+
+    raise ValueError(
+        f"Unsupported input format '{ext}'. "
+        f"Expected one of: {', '.join(SUPPORTED_EXTENSIONS)}"
+    )
+
+
+class _FlatTableReader(ABC):
+    """
+    Common behaviour of single-table inputs (CSV, Parquet, Feather).
+
+    Subclasses provide the header, a full (projected) read and a
+    chunked (projected) read.
+    """
+
+    def __init__(self, path: str, cache=None):
+        self.path = path
+        self.cache = cache
+
+    # --------------------------------------------------
+    # PUBLIC API (ExcelReader contract)
+    # --------------------------------------------------
+
+    @contextmanager
+    def session(self):
+        """
+        ExcelReader contract; single-table inputs keep no open
+        handle between reads.
+        """
+        yield self
+
+    def read(
+        self,
+        sheet_name: Optional[str] = None,
+        columns: Optional[List[str]] = None
+    ) -> dict:
+        name = self._check_sheet(sheet_name)
+
+        sheets = None
+
+        if self.cache is not None:
+            sheets = self.cache.get(self.path, sheet_name, columns)
+
+        if sheets is None:
+            sheets = {name: self._read_table(self._projection(columns))}
+
+            if self.cache is not None:
+                self.cache.put(self.path, sheets, sheet_name, columns)
+
+        for df in sheets.values():
+            df._table_name = self.table_name()
+
+        return sheets
+
+    def read_headers(self, sheet_name: Optional[str] = None) -> Dict[str, List[str]]:
+        return {self._check_sheet(sheet_name): self._header()}
+
+    def probe(
+        self,
+        sheet_name: Optional[str] = None,
+        n_rows: int = 5
+    ) -> Dict[str, SheetPreview]:
+        name = self._check_sheet(sheet_name)
+        columns = self._header()
+
+        return {
+            name: SheetPreview(
+                name=name,
+                columns=columns,
+                sample=self._head(n_rows)
+            )
+        }
+
+    def iter_sheet_rows(
+        self,
+        sheet_name: Optional[str] = None,
+        columns: Optional[List[str]] = None
+    ) -> Iterator[Tuple[str, List[str], Iterator[tuple]]]:
+        """
+        Streams the table chunk by chunk. Missing values come back
+        as None, like empty Excel cells.
+        """
+        name = self._check_sheet(sheet_name)
+        names = (
+            self._projection(columns)
+            if columns is not None
+            else self._header()
+        )
+
+        yield name, names, (
+            row
+            for chunk in self._iter_frames(names)
+            for row in chunk.astype(object)
+            .where(chunk.notna(), None)
+            .itertuples(index=False, name=None)
+        )
+
+    def table_name(self) -> str:
+        return os.path.splitext(os.path.basename(self.path))[0]
+
+    # --------------------------------------------------
+    # INTERNAL HELPERS
+    # --------------------------------------------------
+
+    def _check_sheet(self, sheet_name: Optional[str]) -> str:
+        name = self.table_name()
+
+        if sheet_name is not None and sheet_name != name:
+            raise ValueError(f"Worksheet not found: {sheet_name}")
+
+        return name
+
+    def _projection(self, columns: Optional[List[str]]) -> Optional[List[str]]:
+        if columns is None:
+            return None
+
+        wanted = set(columns)
+        return [c for c in self._header() if c in wanted]
+
+    @abstractmethod
+    def _header(self) -> List[str]:
+        ...
+
+    @abstractmethod
+    def _head(self, n_rows: int) -> pd.DataFrame:
+        ...
+
+    @abstractmethod
+    def _read_table(self, columns: Optional[List[str]]) -> pd.DataFrame:
+        ...
+
+    @abstractmethod
+    def _iter_frames(self, columns: Optional[List[str]]) -> Iterator[pd.DataFrame]:
+        ...
+
+
+class CSVReader(_FlatTableReader):
+    """
+    Reads delimited text files. The delimiter is sniffed from the
+    header line unless given.
+
+    ``read`` parses the whole (projected) table at once and holds
+    it in memory. Large files should go through ``iter_sheet_rows``
+    (``--stream``), which parses ``chunksize`` rows at a time.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        cache=None,
+        sep: Optional[str] = None,
+        encoding: str = "utf-8-sig",
+        chunksize: int = 200_000
+    ):
+        super().__init__(path, cache=cache)
+        self.encoding = encoding
+        self.chunksize = chunksize
+        self.sep = sep or self._sniff_sep()
+
+    def _sniff_sep(self) -> str:
+        with open(self.path, encoding=self.encoding, newline="") as f:
+            line = f.readline()
+
+        try:
+            return csv.Sniffer().sniff(line, delimiters=",;\t|").delimiter
+        except csv.Error:
+            return ","
+
+    def _csv_kwargs(self, columns: Optional[List[str]]) -> dict:
+        return {
+            "sep": self.sep,
+            "encoding": self.encoding,
+            "usecols": columns,
+        }
+
+    def _header(self) -> List[str]:
+        return list(self._head(0).columns)
+
+    def _head(self, n_rows: int) -> pd.DataFrame:
+        return pd.read_csv(self.path, nrows=n_rows, **self._csv_kwargs(None))
+
+    def _read_table(self, columns: Optional[List[str]]) -> pd.DataFrame:
+        return pd.read_csv(self.path, **self._csv_kwargs(columns))
+
+    def _iter_frames(self, columns: Optional[List[str]]) -> Iterator[pd.DataFrame]:
+        with pd.read_csv(
+            self.path,
+            chunksize=self.chunksize,
+            **self._csv_kwargs(columns)
+        ) as reader:
+            yield from reader
+
+
+class ParquetReader(_FlatTableReader):
+    """
+    Reads Parquet files (requires pyarrow). Column projection is
+    pushed down to the Parquet reader.
+    """
+
+    def __init__(self, path: str, cache=None, batch_size: int = 200_000):
+        super().__init__(path, cache=cache)
+        self.batch_size = batch_size
+
+    def _file(self):
+        import pyarrow.parquet as pq
+
+        return pq.ParquetFile(self.path)
+
+    def _header(self) -> List[str]:
+        return list(self._file().schema_arrow.names)
+
+    def _head(self, n_rows: int) -> pd.DataFrame:
+        if n_rows <= 0:
+            return pd.DataFrame(columns=self._header())
+
+        batch = next(self._file().iter_batches(batch_size=n_rows), None)
+        if batch is None:
+            return pd.DataFrame(columns=self._header())
+
+        return batch.to_pandas()
+
+    def _read_table(self, columns: Optional[List[str]]) -> pd.DataFrame:
+        return pd.read_parquet(self.path, columns=columns)
+
+    def _iter_frames(self, columns: Optional[List[str]]) -> Iterator[pd.DataFrame]:
+        for batch in self._file().iter_batches(
+            batch_size=self.batch_size,
+            columns=columns
+        ):
+            yield batch.to_pandas()
+
+
+class FeatherReader(_FlatTableReader):
+    """
+    Reads Feather (Arrow IPC) files (requires pyarrow). The file is
+    memory-mapped, so projected reads only touch the selected columns.
+    """
+
+    def _table(self, columns: Optional[List[str]] = None):
+        import pyarrow.feather as feather
+
+        return feather.read_table(self.path, columns=columns, memory_map=True)
+
+    def _header(self) -> List[str]:
+        return list(self._table().schema.names)
+
+    def _head(self, n_rows: int) -> pd.DataFrame:
+        return self._table().slice(0, n_rows).to_pandas()
+
+    def _read_table(self, columns: Optional[List[str]]) -> pd.DataFrame:
+        return self._table(columns).to_pandas()
+
+    def _iter_frames(self, columns: Optional[List[str]]) -> Iterator[pd.DataFrame]:
+        for batch in self._table(columns).to_batches():
+            yield batch.to_pandas()
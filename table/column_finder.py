@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from functools import lru_cache
 from typing import Tuple, List, Optional
 import unicodedata
 
@@ -34,10 +35,16 @@ def normalize_text(text: str) -> str:
     if text is None:
         return ""
 
-    text = str(text).strip().upper()
+    return _normalize(str(text))
+
+
+@lru_cache(maxsize=4096)
+def _normalize(text: str) -> str:
+    # Headers repeat across blocks, sheets and files: memoized,
+    # bounded so arbitrary cell text cannot grow it without limit
+    text = text.strip().upper()
     text = unicodedata.normalize("NFD", text)
-    text = "".join(c for c in text if unicodedata.category(c) != "Mn")
-    return text
+    return "".join(c for c in text if unicodedata.category(c) != "Mn")
 
 
 # --------------------------------------------------
@@ -61,10 +68,18 @@ class ColumnFinder:
         "Y", "N", "NORTH", "NORTE", "COORDY", "COORD_Y", "Y_COORD"
     }
 
-    def __init__(self, df: pd.DataFrame):
-        self.df = df
+    def __init__(self, df):
+        """
+        Parameters
+        ----------
+        df : pandas.DataFrame or list of str
+            Table, or just its header row.
+        """
+        self.columns = list(
+            df.columns if isinstance(df, pd.DataFrame) else df
+        )
         self.normalized_columns = {
-            col: normalize_text(col) for col in df.columns
+            col: normalize_text(col) for col in self.columns
         }
 
     # --------------------------------------------------
@@ -131,6 +146,6 @@ class ColumnFinder:
         Returns a short diagnostic summary.
         """
         return (
-            f"Detected columns: {list(self.df.columns)} | "
+            f"Detected columns: {self.columns} | "
             f"Normalized: {list(self.normalized_columns.values())}"
         )
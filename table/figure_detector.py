@@ -13,8 +13,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import numpy as np
 import pandas as pd
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+
+from pytab2gis.table.table_detector import BlockRange, SheetStore, TableBlock
 
 
 def detect_figures(
@@ -55,28 +58,89 @@ def detect_figures(
         df[vertex_column], errors="coerce"
     )
 
-    if df[vertex_column].isna().any():
+    rows, ranges = detect_figure_ranges(df, vertex_column)
+
+    return {
+        r.name: df.iloc[rows[r.start:r.stop]]
+        for r in ranges
+    }
+
+
+def detect_figure_ranges(
+    df: pd.DataFrame,
+    vertex_column: str = "VERTICE"
+) -> Tuple[np.ndarray, List[BlockRange]]:
+    """
+    Splits a table into figures wherever the vertex number does
+    not increase (``diff() <= 0``), in one vectorized pass.
+
+    Fully empty rows are ignored.
+
+    Returns
+    -------
+    (rows, ranges)
+        ``rows`` are the positions of the non-empty rows;
+        ``ranges`` hold ``[start, stop)`` bounds into ``rows``,
+        named ``figure_1``, ``figure_2``, ...
+
+    Raises
+    ------
+    ValueError
+        If the vertex column has non-numeric values.
+    """
+    if vertex_column not in df.columns:
+        raise ValueError(f"Vertex column not found: {vertex_column}")
+
+    rows = np.flatnonzero(~df.isna().all(axis=1).to_numpy())
+
+    vertices = pd.to_numeric(
+        df[vertex_column].iloc[rows], errors="coerce"
+    ).to_numpy("float64", na_value=np.nan)
+
+    if np.isnan(vertices).any():
         raise ValueError(
             f"Vertex column '{vertex_column}' contains non-numeric values."
         )
 
-    figures: Dict[str, pd.DataFrame] = {}
-    current_rows = []
-    figure_index = 1
-    prev_vertex = None
+    starts = np.flatnonzero(np.r_[True, np.diff(vertices) <= 0]) \
+        if len(vertices) else np.empty(0, dtype="int64")
+    stops = np.r_[starts[1:], len(vertices)]
 
-    for _, row in df.iterrows():
-        vertex = row[vertex_column]
+    ranges = [
+        BlockRange(
+            name=f"figure_{i}",
+            table_id=f"T{i}",
+            start=int(start),
+            stop=int(stop)
+        )
+        for i, (start, stop) in enumerate(zip(starts, stops), start=1)
+    ]
 
-        if prev_vertex is not None and vertex <= prev_vertex:
-            figures[f"figure_{figure_index}"] = pd.DataFrame(current_rows)
-            figure_index += 1
-            current_rows = []
+    return rows, ranges
 
-        current_rows.append(row)
-        prev_vertex = vertex
 
-    if current_rows:
-        figures[f"figure_{figure_index}"] = pd.DataFrame(current_rows)
+def detect_figure_blocks(
+    df: pd.DataFrame,
+    vertex_column: str = "VERTICE"
+) -> List[TableBlock]:
+    """
+    Vertex-reset counterpart of ``TableDetector.detect_tables`` for
+    sheets without a component column.
+    """
+    rows, ranges = detect_figure_ranges(df, vertex_column)
 
-    return figures
+    store = SheetStore(
+        df,
+        rows=None if len(rows) == len(df) else rows
+    )
+
+    return [
+        TableBlock(
+            name=r.name,
+            store=store,
+            start=r.start,
+            stop=r.stop,
+            table_id=r.table_id
+        )
+        for r in ranges
+    ]
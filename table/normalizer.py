@@ -13,3 +13,95 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+
+import numpy as np
+import pandas as pd
+
+
+# Optional text prefix, last run of digits, optional text suffix
+_VERTEX_PATTERN = r"^(?P<prefix>.*?)(?P<number>\d+)(?P<suffix>\D*)$"
+
+
+def vertex_sort_keys(values) -> np.ndarray:
+    """
+    Natural-order sort keys for a vertex column, as int64 ranks.
+
+    Handles numeric vertices (1, 2.0, "003") and alphanumeric codes
+    ("V1", "V2", "V10", "P-003") without per-cell Python calls:
+
+    - numeric values sort first, by value
+    - codes sort by text prefix, then number, then suffix
+    - missing vertices sort last
+
+    Equal vertices get equal keys, so a stable sort keeps their
+    original row order.
+    """
+    s = pd.Series(values).reset_index(drop=True)
+
+    # Fast path: already numeric
+    if (
+        pd.api.types.is_numeric_dtype(s.dtype)
+        and not pd.api.types.is_bool_dtype(s.dtype)
+    ):
+        return _dense_rank(s.to_numpy("float64", na_value=np.nan))
+
+    text = s.astype("string").str.strip()
+    number = pd.to_numeric(text, errors="coerce") \
+        .to_numpy("float64", na_value=np.nan)
+
+    parts = text.str.extract(_VERTEX_PATTERN)
+    is_code = np.isnan(number) & parts["number"].notna().to_numpy()
+
+    # Codes: numeric part of the last digit run
+    number[is_code] = parts["number"][is_code].astype("float64").to_numpy()
+
+    has_text = np.isnan(number) & text.notna().to_numpy()
+
+    prefix = pd.Series("", index=s.index, dtype="string")
+    prefix[is_code] = parts["prefix"][is_code]
+    # No digits at all: the whole text is the prefix
+    prefix[has_text] = text[has_text]
+
+    suffix = pd.Series("", index=s.index, dtype="string")
+    suffix[is_code] = parts["suffix"][is_code]
+
+    prefix_codes, _ = pd.factorize(prefix, sort=True)
+    suffix_codes, _ = pd.factorize(suffix, sort=True)
+
+    # Pure text sorts before numbered codes of the same prefix;
+    # missing vertices go last (NaN)
+    number[has_text] = -1.0
+
+    return _dense_rank(number, prefix_codes, suffix_codes)
+
+
+def _dense_rank(
+    number: np.ndarray,
+    prefix: np.ndarray = None,
+    suffix: np.ndarray = None
+) -> np.ndarray:
+    """
+    Dense int64 rank of rows ordered by (prefix, number, suffix).
+    NaN numbers rank after everything else.
+    """
+    missing = np.isnan(number)
+    number = np.where(missing, 0.0, number)
+
+    # np.lexsort: last key is the primary one
+    keys = [number, missing]
+    if prefix is not None:
+        keys = [suffix, number, prefix, missing]
+
+    order = np.lexsort(keys)
+
+    ranks = np.empty(len(number), dtype="int64")
+    if len(order) == 0:
+        return ranks
+
+    changed = np.zeros(len(order), dtype=bool)
+    for key in keys:
+        k = key[order]
+        changed[1:] |= k[1:] != k[:-1]
+
+    ranks[order] = np.cumsum(changed)
+    return ranks
@@ -13,36 +13,175 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+import numpy as np
 import pandas as pd
 
 
+class SheetStore:
+    """
+    Shared columnar view of one sheet.
+
+    Column arrays are taken from the sheet lazily (``to_numpy``,
+    which does not copy numeric columns) and shared by every
+    TableBlock of the sheet. An optional row selection maps block
+    positions to sheet rows when empty rows were dropped, so the
+    sheet itself is never filtered or copied.
+    """
+
+    def __init__(self, frame: pd.DataFrame, rows: Optional[np.ndarray] = None):
+        self.frame = frame
+        self.rows = rows
+        self._arrays: Dict[Any, np.ndarray] = {}
+        self._numeric: Dict[Any, np.ndarray] = {}
+
+    def __len__(self):
+        return len(self.frame) if self.rows is None else len(self.rows)
+
+    @property
+    def columns(self) -> List[Any]:
+        return list(self.frame.columns)
+
+    def array(self, column) -> np.ndarray:
+        """
+        Whole-sheet array of a column (memoized).
+        """
+        if column not in self._arrays:
+            self._arrays[column] = self.frame[column].to_numpy()
+        return self._arrays[column]
+
+    def numeric_array(self, column) -> np.ndarray:
+        """
+        Whole-sheet float64 version of a column (memoized);
+        non-numeric cells become NaN. Converted once per sheet,
+        not once per block.
+        """
+        if column not in self._numeric:
+            values = self.array(column)
+
+            if values.dtype.kind in "fiu":
+                numeric = values.astype("float64", copy=False)
+            else:
+                numeric = pd.to_numeric(
+                    pd.Series(values), errors="coerce"
+                ).to_numpy("float64", na_value=np.nan)
+
+            self._numeric[column] = numeric
+
+        return self._numeric[column]
+
+    def take(
+        self,
+        column,
+        start: int,
+        stop: int,
+        numeric: bool = False
+    ) -> np.ndarray:
+        """
+        Values of ``column`` for block positions ``[start, stop)``:
+        a view when no rows were dropped, else a small gather.
+        """
+        values = self.numeric_array(column) if numeric else self.array(column)
+
+        if self.rows is None:
+            return values[start:stop]
+
+        return values[self.rows[start:stop]]
+
+    def index(self, start: int, stop: int) -> pd.Index:
+        """
+        Source row labels for block positions ``[start, stop)``.
+        """
+        if self.rows is None:
+            return self.frame.index[start:stop]
+
+        return self.frame.index[self.rows[start:stop]]
+
+    def materialize(self, start: int, stop: int) -> pd.DataFrame:
+        if self.rows is None:
+            return self.frame.iloc[start:stop]
+
+        return self.frame.iloc[self.rows[start:stop]]
+
+
 class TableBlock:
     """
     Represents a detected table block corresponding to a single figure.
+
+    A block is a lightweight slice (offset and length) into the
+    SheetStore of its sheet. Row data is only materialized as a
+    DataFrame when ``rows`` is accessed.
     """
 
     def __init__(
         self,
         name: str,
-        rows: pd.DataFrame,
+        store: SheetStore,
+        start: int = 0,
+        stop: Optional[int] = None,
         table_id: Optional[str] = None
     ):
         self.name = name
-        self.rows = rows
+        self.store = store
+        self.start = start
+        self.stop = len(store) if stop is None else stop
         self.table_id = table_id
 
+    @classmethod
+    def from_frame(
+        cls,
+        name: str,
+        rows: pd.DataFrame,
+        table_id: Optional[str] = None
+    ) -> "TableBlock":
+        """
+        Block owning a standalone DataFrame (e.g. streamed rows).
+        """
+        return cls(name, SheetStore(rows), table_id=table_id)
+
+    @property
+    def columns(self) -> List[Any]:
+        return self.store.columns
+
+    @property
+    def index(self) -> pd.Index:
+        return self.store.index(self.start, self.stop)
+
+    @property
+    def rows(self) -> pd.DataFrame:
+        return self.store.materialize(self.start, self.stop)
+
+    def column(self, name) -> np.ndarray:
+        return self.store.take(name, self.start, self.stop)
+
+    def numeric_column(self, name) -> np.ndarray:
+        """
+        float64 values of a column (NaN where not numeric).
+        """
+        return self.store.take(name, self.start, self.stop, numeric=True)
+
     def __len__(self):
-        return len(self.rows)
+        return self.stop - self.start
 
     def summary(self) -> str:
         return (
             f"TableBlock(name='{self.name}', "
-            f"rows={len(self.rows)}, "
+            f"rows={len(self)}, "
             f"id={self.table_id})"
         )
 
 
+class BlockRange(NamedTuple):
+    """
+    Positional row range ``[start, stop)`` of a detected block.
+    """
+    name: str
+    table_id: str
+    start: int
+    stop: int
+
+
 class TableDetector:
     """
     Detects and splits a DataFrame into logical table blocks (figures).
@@ -58,7 +197,7 @@ class TableDetector:
         df: pd.DataFrame,
         component_column: str
     ):
-        self.df = df.copy()
+        self.df = df
         self.component_column = component_column
 
     # --------------------------------------------------
@@ -73,55 +212,145 @@ class TableDetector:
         -------
         list of TableBlock
         """
-        blocks: List[TableBlock] = []
-
-        current_name: Optional[str] = None
-        current_rows: List[int] = []
-        block_counter = 1
-
-        for idx, row in self.df.iterrows():
-            component_value = row.get(self.component_column)
-
-            # Normalize component cell
-            if isinstance(component_value, str):
-                component_value = component_value.strip()
-
-            # New component detected
-            if component_value not in (None, "", pd.NA):
-                # Flush previous block
-                if current_name is not None and current_rows:
-                    block_df = self.df.loc[current_rows].copy()
-                    blocks.append(
-                        TableBlock(
-                            name=current_name,
-                            rows=block_df,
-                            table_id=f"T{block_counter}"
-                        )
-                    )
-                    block_counter += 1
-                    current_rows = []
-
-                current_name = str(component_value)
-
-            # Skip rows until a component name is defined
-            if current_name is None:
-                continue
-
-            # Skip fully empty rows
-            if row.isna().all():
-                continue
-
-            current_rows.append(idx)
-
-        # Flush last block
-        if current_name is not None and current_rows:
-            block_df = self.df.loc[current_rows].copy()
-            blocks.append(
-                TableBlock(
-                    name=current_name,
-                    rows=block_df,
-                    table_id=f"T{block_counter}"
-                )
+        store, ranges = self.detect_block_ranges()
+
+        return [
+            TableBlock(
+                name=r.name,
+                store=store,
+                start=r.start,
+                stop=r.stop,
+                table_id=r.table_id
+            )
+            for r in ranges
+        ]
+
+    def detect_block_ranges(self) -> Tuple[SheetStore, List[BlockRange]]:
+        """
+        Finds block boundaries in one vectorized pass.
+
+        A new block starts at every non-empty component cell; rows
+        before the first component and fully empty rows are dropped.
+        After dropping, every block is a contiguous row range.
+
+        Returns
+        -------
+        (store, ranges)
+            ``store`` views the sheet without dropped rows (no data
+            is copied); ``ranges`` hold positional ``[start, stop)``
+            bounds into it.
+        """
+        if self.component_column not in self.df.columns:
+            raise ValueError(
+                f"Selected component column not found: {self.component_column}"
+            )
+
+        # Normalize component cells
+        component = self.df[self.component_column] \
+            .astype("string").str.strip()
+        is_start = (component.notna() & (component != "")) \
+            .to_numpy(dtype=bool, na_value=False)
+
+        # Block id per row; 0 = before the first component name
+        block_id = np.cumsum(is_start)
+
+        # Skip rows until a component name is defined, and fully
+        # empty rows
+        keep = (block_id > 0) & ~self.df.isna().all(axis=1).to_numpy()
+
+        store = SheetStore(
+            self.df,
+            rows=None if keep.all() else np.flatnonzero(keep)
+        )
+
+        # Start rows are never empty, so each name opens one range
+        kept_ids = block_id[keep]
+        starts = np.flatnonzero(
+            np.r_[True, kept_ids[1:] != kept_ids[:-1]]
+        ) if len(kept_ids) else np.empty(0, dtype="int64")
+        stops = np.r_[starts[1:], len(kept_ids)]
+
+        names = component.to_numpy(dtype=object)[is_start]
+
+        ranges = [
+            BlockRange(
+                name=str(name),
+                table_id=f"T{i}",
+                start=int(start),
+                stop=int(stop)
             )
+            for i, (name, start, stop) in enumerate(
+                zip(names, starts, stops), start=1
+            )
+        ]
+
+        return store, ranges
+
+
+def stream_table_blocks(
+    columns: List[str],
+    rows: Iterable[tuple],
+    component_column: str
+) -> Iterator[TableBlock]:
+    """
+    Streaming counterpart of ``TableDetector.detect_tables``.
+
+    Consumes raw value tuples (e.g. from ``ExcelReader.iter_sheet_rows``)
+    and yields each TableBlock as soon as the next component name
+    appears. Only the rows of the block being assembled are kept in
+    memory.
+    """
+    if component_column not in columns:
+        raise ValueError(
+            f"Selected component column not found: {component_column}"
+        )
+
+    component_pos = columns.index(component_column)
+
+    current_name: Optional[str] = None
+    current_rows: List[tuple] = []
+    current_index: List[int] = []
+    block_counter = 1
+
+    def _flush() -> TableBlock:
+        return TableBlock.from_frame(
+            name=current_name,
+            rows=pd.DataFrame(
+                current_rows,
+                columns=columns,
+                index=current_index
+            ),
+            table_id=f"T{block_counter}"
+        )
+
+    for idx, row in enumerate(rows):
+        component_value = row[component_pos]
+
+        # Normalize component cell
+        if isinstance(component_value, str):
+            component_value = component_value.strip()
+
+        # New component detected
+        if component_value not in (None, ""):
+            if current_name is not None and current_rows:
+                yield _flush()
+                block_counter += 1
+                current_rows = []
+                current_index = []
+
+            current_name = str(component_value)
+
+        # Skip rows until a component name is defined
+        if current_name is None:
+            continue
+
+        # Skip fully empty rows
+        if all(v is None for v in row):
+            continue
+
+        current_rows.append(row)
+        current_index.append(idx)
 
-        return blocks
+    # Flush last block
+    if current_name is not None and current_rows:
+        yield _flush()
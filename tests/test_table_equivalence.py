@@ -0,0 +1,306 @@
+# Copyright (c) 2026 Jordan Zavaleta
+# This file is part of PyTAB2GIS.
+# PyTAB2GIS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# The vectorized table code checked against the row-by-row
+# implementations it replaced, on one workbook.
+
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+from shapely.geometry import LineString, Polygon
+
+from pytab2gis.config.table_config import TableConfig
+from pytab2gis.crs.crs_manager import CRSDefinition, CRSManager
+from pytab2gis.figures.figure_builder import FigureBuilder
+from pytab2gis.io.excel_reader import ExcelReader, build_geometries_from_table
+from pytab2gis.table.figure_detector import detect_figure_ranges
+from pytab2gis.table.normalizer import vertex_sort_keys
+from pytab2gis.table.table_detector import TableDetector
+
+HEADER = ["COMPONENTE", "VERTICE", "ESTE", "NORTE"]
+
+COMPONENT_ROWS = [
+    # Open ring, vertices out of order, one row without coordinates
+    ["P1", "V3", 10, 10],
+    [None, "V1", 0, 0],
+    [None, "V4", 0, 10],
+    [None, "V5", None, None],
+    [None, "V2", 10, 0],
+    [None, None, None, None],
+    # Closed ring
+    ["P2", "V1", 20, 0],
+    [None, "V2", 30, 0],
+    [None, "V3", 25, 8],
+    [None, "V4", 20, 0],
+    # Two vertices: a line
+    ["P3", "V1", 40, 0],
+    [None, "V2", 45, 5],
+    # Bow tie, repaired with buffer(0)
+    ["P4", "V1", 50, 0],
+    [None, "V2", 60, 10],
+    [None, "V3", 60, 0],
+    [None, "V4", 50, 10],
+    # Single vertex: no geometry
+    ["P5", "V1", 70, 0],
+]
+
+RESET_ROWS = [
+    [1, 0, 0],
+    [2, 10, 0],
+    [3, 10, 10],
+    [4, 0, 10],
+    [1, 20, 0],
+    [2, 30, 0],
+    [3, "s/n", "s/n"],
+    [4, 25, 8],
+    [1, 40, 0],
+    [2, 45, 5],
+    # Repeated vertex number also starts a figure
+    [2, 50, 0],
+    [3, 60, 0],
+    [4, 55, 8],
+]
+
+
+@pytest.fixture
+def sheets(tmp_path):
+    wb = Workbook()
+
+    ws = wb.active
+    ws.title = "componentes"
+    ws.append(HEADER)
+    for row in COMPONENT_ROWS:
+        ws.append(row)
+
+    ws = wb.create_sheet("reinicio")
+    ws.append(HEADER[1:])
+    for row in RESET_ROWS:
+        ws.append(row)
+
+    path = tmp_path / "predio.xlsx"
+    wb.save(path)
+
+    return ExcelReader(str(path)).read()
+
+
+# --------------------------------------------------
+# ROW-BY-ROW REFERENCES
+# --------------------------------------------------
+
+def _reference_geometries(df, config, name=None):
+    """
+    Row-loop ``build_geometries_from_table``. Text coordinates
+    (e.g. "s/n") made it fail; they are dropped like empty cells.
+    """
+    x_col, y_col = config.x_column, config.y_column
+    vertex_col = config.vertex_column
+    component_col = config.component_column
+
+    df = df.copy()
+    df[x_col] = pd.to_numeric(df[x_col], errors="coerce")
+    df[y_col] = pd.to_numeric(df[y_col], errors="coerce")
+    df = df.dropna(subset=[x_col, y_col])
+    df[vertex_col] = df[vertex_col].astype(str).str.strip()
+
+    def _vertex_key(v):
+        try:
+            return int(v)
+        except Exception:
+            return v
+
+    if component_col is not None:
+        df[component_col] = df[component_col].ffill()
+        groups = df.groupby(component_col)
+    else:
+        groups = [(name, df)]
+
+    geometries = []
+
+    for group_name, g in groups:
+        g = g.copy()
+        g["_vkey"] = g[vertex_col].apply(_vertex_key)
+        g = g.sort_values("_vkey")
+
+        coords = list(zip(g[x_col], g[y_col]))
+
+        if len(coords) < 2:
+            continue
+
+        if len(coords) >= 3:
+            geom = Polygon(coords)
+            if not geom.is_valid:
+                geom = geom.buffer(0)
+        else:
+            geom = LineString(coords)
+
+        if geom.is_empty or not geom.is_valid:
+            continue
+
+        geometries.append((str(group_name), geom))
+
+    return geometries
+
+
+def _reference_figures(df, vertex_column="VERTICE"):
+    """
+    Row-loop vertex reset detection: figure name -> row labels.
+    """
+    vertices = pd.to_numeric(df[vertex_column], errors="coerce")
+
+    figures = {}
+    current = []
+    figure_index = 1
+    prev_vertex = None
+
+    for idx, vertex in vertices.items():
+        if prev_vertex is not None and vertex <= prev_vertex:
+            figures[f"figure_{figure_index}"] = current
+            figure_index += 1
+            current = []
+
+        current.append(idx)
+        prev_vertex = vertex
+
+    if current:
+        figures[f"figure_{figure_index}"] = current
+
+    return figures
+
+
+def _reference_blocks(df, component_column, x_col="ESTE", y_col="NORTE"):
+    """
+    Row-loop ``TableDetector.detect_tables`` followed by the
+    row-loop vertex extraction of ``FigureBuilder``. Its
+    ``value not in (None, "", pd.NA)`` test raised on every cell
+    (comparisons with pd.NA are ambiguous); the intended emptiness
+    check is used instead.
+    """
+    blocks = []
+    current_name, current_rows = None, []
+
+    for idx, row in df.iterrows():
+        value = row.get(component_column)
+
+        if isinstance(value, str):
+            value = value.strip()
+
+        if not pd.isna(value) and value != "":
+            if current_name is not None and current_rows:
+                blocks.append((current_name, current_rows))
+                current_rows = []
+            current_name = str(value)
+
+        if current_name is None or row.isna().all():
+            continue
+
+        current_rows.append(idx)
+
+    if current_name is not None and current_rows:
+        blocks.append((current_name, current_rows))
+
+    result = []
+    for name, rows in blocks:
+        vertices = []
+        for _, row in df.loc[rows].iterrows():
+            try:
+                vertices.append((float(row[x_col]), float(row[y_col])))
+            except (TypeError, ValueError):
+                continue
+        # Empty cells came through as NaN vertices; they are dropped
+        # now, like text
+        result.append(
+            (name, rows, [v for v in vertices if np.isfinite(v).all()])
+        )
+
+    return result
+
+
+def _assert_same_geometries(actual, expected):
+    assert [name for name, _ in actual] == [name for name, _ in expected]
+
+    for (name, geom), (_, ref) in zip(actual, expected):
+        assert geom.geom_type == ref.geom_type, name
+        assert geom.equals_exact(ref, 0), name
+
+
+# --------------------------------------------------
+# TESTS
+# --------------------------------------------------
+
+def test_component_geometries_match_row_loop(sheets):
+    df = sheets["componentes"]
+    config = TableConfig(component_column="COMPONENTE")
+
+    actual = build_geometries_from_table(df, config)
+    expected = _reference_geometries(df, config)
+
+    assert [name for name, _ in actual] == ["P1", "P2", "P3", "P4"]
+    _assert_same_geometries(actual, expected)
+
+
+def test_vertex_reset_matches_row_loop(sheets):
+    df = sheets["reinicio"]
+    config = TableConfig(split_on_vertex_reset=True)
+
+    rows, ranges = detect_figure_ranges(df)
+    reference = _reference_figures(df)
+
+    assert {
+        r.name: list(df.index[rows[r.start:r.stop]]) for r in ranges
+    } == reference
+
+    actual = build_geometries_from_table(df, config)
+
+    expected = []
+    for name, labels in reference.items():
+        expected += _reference_geometries(
+            df.loc[labels], config, name=f"{df._table_name}_{name}"
+        )
+
+    assert len(actual) == 4
+    _assert_same_geometries(actual, expected)
+
+
+def test_table_blocks_match_row_loop(sheets):
+    df = sheets["componentes"]
+
+    blocks = TableDetector(df, "COMPONENTE").detect_tables()
+    reference = _reference_blocks(df, "COMPONENTE")
+
+    assert [(b.name, list(b.index)) for b in blocks] == [
+        (name, rows) for name, rows, _ in reference
+    ]
+
+    collection = FigureBuilder(
+        CRSManager(CRSDefinition(epsg=32718))
+    ).build_many(blocks, xy_columns=("ESTE", "NORTE"))
+
+    vertices = {name: v for name, _, v in reference}
+    for figure in collection:
+        assert figure.vertices.tolist() == [list(v) for v in vertices[figure.name]]
+
+    # Lines and single vertices are rejected as figures
+    assert list(collection.names) == ["P1", "P2", "P4"]
+    assert [name for name, _ in collection.rejected] == ["P3", "P5"]
+
+
+def test_alphanumeric_vertices_sort_naturally():
+    # Intended change: the row loop compared "V10" and "V9" as text
+    labels = pd.Series(["V10", "V9", "V1", "V2"])
+
+    order = np.argsort(vertex_sort_keys(labels), kind="stable")
+
+    assert labels[order].tolist() == ["V1", "V2", "V9", "V10"]
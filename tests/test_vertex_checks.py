@@ -0,0 +1,45 @@
+# Copyright (c) 2026 Jordan Zavaleta
+# This file is part of PyTAB2GIS.
+# PyTAB2GIS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+from pytab2gis.figures.figure_collection import FigureCollection
+from pytab2gis.figures.vertex_checks import VertexChecker
+
+
+def _collection(figures, names):
+    coords = np.array([p for f in figures for p in f], dtype=float)
+    offsets = np.cumsum([0] + [len(f) for f in figures])
+    return FigureCollection(coords, offsets, np.array(names, dtype=object), None)
+
+
+def test_degenerate_ring_between_valid_rings():
+    # A-B-B-A has fewer than three distinct ring vertices and must
+    # not break the ring indices of the figures after it
+    collection = _collection(
+        [
+            [(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)],
+            [(5, 5), (6, 5), (6, 5), (5, 5)],
+            [(10, 0), (11, 1), (11, 0), (10, 1), (10, 0)],
+        ],
+        ["square", "abba", "bowtie"],
+    )
+
+    diagnostics = VertexChecker().check(collection)
+    counts = diagnostics.counts()
+
+    assert counts["duplicate_vertex"] == 1
+    assert counts["self_intersection"] == 1
+    assert "bowtie" in list(diagnostics.messages())[-1]